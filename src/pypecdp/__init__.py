@@ -1,7 +1,8 @@
 """Public API for pypecdp.
 
 Exports:
-    Browser, Tab, Elem, Config, CookieJar, cdp, logger
+    Browser, Tab, Elem, ElemBatch, Config, CookieJar, cdp, logger,
+    install_uvloop
 """
 
 from __future__ import annotations
@@ -11,18 +12,20 @@ import importlib.metadata
 from . import cdp
 from .browser import Browser
 from .config import Config
-from .elem import Elem
+from .elem import Elem, ElemBatch
 from .logger import logger
 from .tab import Tab
-from .util import CookieJar
+from .util import CookieJar, install_uvloop
 
 __all__: list[str] = [
     "Browser",
     "Tab",
     "Elem",
+    "ElemBatch",
     "Config",
     "CookieJar",
     "cdp",
     "logger",
+    "install_uvloop",
 ]
 __version__: str = importlib.metadata.version("pypecdp")
@@ -0,0 +1,39 @@
+"""JSON serialization for the CDP wire protocol.
+
+Every CDP command and event passes through one (de)serialization here,
+which makes it the hottest JSON path in the package. When `orjson`_ is
+installed it is used transparently (~3-5x faster than the stdlib for
+the small dicts CDP exchanges); otherwise the stdlib ``json`` module is
+used with compact separators.
+
+.. _orjson: https://github.com/ijl/orjson
+"""
+
+from __future__ import annotations
+
+import json
+from typing import Any
+
+try:
+    import orjson
+except ImportError:  # pragma: no cover - exercised only without orjson
+    orjson = None  # type: ignore[assignment]
+
+
+if orjson is not None:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes via orjson."""
+        return orjson.dumps(obj)
+
+    loads = orjson.loads
+else:
+
+    def dumps(obj: Any) -> bytes:
+        """Serialize obj to compact JSON bytes via the stdlib."""
+        return json.dumps(obj, separators=(",", ":")).encode("utf-8")
+
+    loads = json.loads
+
+
+__all__ = ["dumps", "loads"]
@@ -4,13 +4,12 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
-import json
 import time
 from types import ModuleType
 from typing import Any, Callable
 
 # Local CDP modules
-from . import cdp
+from . import _json, cdp
 from .cdp.target import SessionID, TargetID
 from .cdp_pipe import _Writer, launch_chrome_with_pipe
 from .config import Config
@@ -84,9 +83,22 @@ class Browser:
         self.targets: dict[TargetID, Tab] = {}
         self._msg_id: int = 0
         self._pending: dict[int, asyncio.Future[dict[str, Any]]] = {}
+        # Bounds concurrent pipe writes so bulk fan-outs (close_all,
+        # batched enables) cannot burst the pipe; responses are awaited
+        # outside the semaphore
+        self._cdp_semaphore: asyncio.Semaphore = asyncio.Semaphore(
+            self.config.max_concurrent_sends
+        )
+        # Running loop, cached on first command; the browser is bound to
+        # one loop for its lifetime via _recv_task anyway
+        self._loop: asyncio.AbstractEventLoop | None = None
         self._recv_task: asyncio.Task[None] | None = None
         self._session_to_tab: dict[SessionID, Tab] = {}
-        self._handlers: dict[type[Any], list[Callable[[Any], Any]]] = {}
+        # Handlers are stored as (callable, is_coroutine) pairs so
+        # dispatch does not re-introspect each handler per event
+        self._handlers: dict[
+            type[Any], list[tuple[Callable[[Any], Any], bool]]
+        ] = {}
         self._cursor: float = time.perf_counter()
         self._auto_attach: bool = kwargs.get("auto_attach", True)
         self._default_domains: list[ModuleType] = kwargs.get(
@@ -252,25 +264,29 @@ class Browser:
         ignore_errors = kwargs.get("ignore_errors", False)
         method, *params = next(cmd).values()
         payload: dict[str, Any] = params.pop() if params else {}
-        self._msg_id += 1
-        msg_id: int = self._msg_id
-        msg: dict[str, Any] = {"id": msg_id, "method": method}
-        if payload:
-            msg["params"] = payload
-        if session_id:
-            msg["sessionId"] = str(session_id)
-
-        fut: asyncio.Future[dict[str, Any]] = (
-            asyncio.get_running_loop().create_future()
-        )
-        self._pending[msg_id] = fut
-
-        assert self.writer is not None, "Browser not launched"
-        raw: bytes = (json.dumps(msg, separators=(",", ":")) + "\0").encode(
-            "utf-8"
-        )
-        self.writer.write(raw)
-        await self.writer.drain()
+        # The semaphore bounds the writes only and is released once the
+        # payload is drained: holding it until the response arrives would
+        # let a slow command (e.g. a long-poll evaluate) starve every
+        # other command on the connection
+        async with self._cdp_semaphore:
+            self._msg_id += 1
+            msg_id: int = self._msg_id
+            msg: dict[str, Any] = {"id": msg_id, "method": method}
+            if payload:
+                msg["params"] = payload
+            if session_id:
+                msg["sessionId"] = str(session_id)
+
+            loop = self._loop
+            if loop is None:
+                loop = self._loop = asyncio.get_running_loop()
+            fut: asyncio.Future[dict[str, Any]] = loop.create_future()
+            self._pending[msg_id] = fut
+
+            assert self.writer is not None, "Browser not launched"
+            raw: bytes = _json.dumps(msg) + b"\0"
+            self.writer.write(raw)
+            await self.writer.drain()
 
         resp: dict[str, Any] = await fut
         if "error" in resp:
@@ -288,6 +304,57 @@ class Browser:
         except StopIteration as e:
             return e.value
 
+    async def send_raw(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+        *,
+        session_id: SessionID | None = None,
+    ) -> dict[str, Any]:
+        """Send a pre-built CDP command, bypassing the typed command layer.
+
+        Useful for hot paths where the caller already knows the wire
+        method name and parameter dict, avoiding per-call construction
+        of the typed CDP command generator.
+
+        Args:
+            method: CDP method name (e.g. "Input.dispatchMouseEvent").
+            params: Optional parameter dict, serialized as-is.
+            session_id: Optional session ID for tab-specific commands.
+
+        Returns:
+            dict[str, Any]: The raw (unparsed) result dict.
+
+        Raises:
+            RuntimeError: If the CDP command returns an error.
+            ConnectionError: If the CDP pipe is closed.
+        """
+        async with self._cdp_semaphore:
+            self._msg_id += 1
+            msg_id: int = self._msg_id
+            msg: dict[str, Any] = {"id": msg_id, "method": method}
+            if params:
+                msg["params"] = params
+            if session_id:
+                msg["sessionId"] = str(session_id)
+
+            loop = self._loop
+            if loop is None:
+                loop = self._loop = asyncio.get_running_loop()
+            fut: asyncio.Future[dict[str, Any]] = loop.create_future()
+            self._pending[msg_id] = fut
+
+            assert self.writer is not None, "Browser not launched"
+            raw: bytes = _json.dumps(msg) + b"\0"
+            self.writer.write(raw)
+            await self.writer.drain()
+
+        resp: dict[str, Any] = await fut
+        if "error" in resp:
+            raise RuntimeError(f"CDP error {resp['error']})")
+        result: dict[str, Any] = resp.get("result", {})
+        return result
+
     async def _recv_loop(
         self,
     ) -> None:
@@ -317,7 +384,7 @@ class Browser:
                 return None
 
             try:
-                msg: dict[str, Any] = json.loads(line[:-1])
+                msg: dict[str, Any] = _json.loads(line[:-1])
             except Exception as exc:
                 logger.exception("JSON parse error in CDP recv: %s", exc)
                 continue
@@ -413,8 +480,19 @@ class Browser:
                 tab.session_id = sid
                 self._session_to_tab[sid] = tab
                 if tab.type in {"page", "iframe"}:
-                    for domain in self._default_domains:
-                        asyncio.ensure_future(tab.send(domain.enable()))
+                    # The enables are independent; issue them as one
+                    # concurrent batch instead of one future per domain.
+                    # return_exceptions keeps a failed enable from
+                    # surfacing as an unretrieved task exception.
+                    asyncio.ensure_future(
+                        asyncio.gather(
+                            *(
+                                tab.send(domain.enable())
+                                for domain in self._default_domains
+                            ),
+                            return_exceptions=True,
+                        )
+                    )
 
         elif method == cdp.target.DetachedFromTarget:
             # event is a DetachedFromTarget object with session_id attribute
@@ -435,10 +513,12 @@ class Browser:
                 if tab:
                     tab.target_info = info
 
-        # Dispatch to registered browser-level handlers
-        for h in self._handlers.get(method, []):
+        # Dispatch to registered browser-level handlers; each handler
+        # was classified at registration time, so no per-event
+        # introspection here
+        for h, is_coro in self._handlers.get(method, ()):
             try:
-                if asyncio.iscoroutinefunction(h) or asyncio.iscoroutine(h):
+                if is_coro:
                     await h(event)
                 else:
                     h(event)
@@ -476,6 +556,24 @@ class Browser:
         await asyncio.sleep(0.1)
         return tab
 
+    async def close_all(
+        self,
+    ) -> None:
+        """Close all known tabs concurrently.
+
+        Each close is bounded by `Tab.close`'s own timeout and failures
+        are swallowed, so teardown of many tabs takes roughly one
+        round-trip instead of one per tab and cannot hang on a dead
+        connection.
+        """
+        tabs = list(self.targets.values())
+        if not tabs:
+            return
+        await asyncio.gather(
+            *(tab.close() for tab in tabs),
+            return_exceptions=True,
+        )
+
     async def navigate(
         self,
         url: str,
@@ -515,7 +613,10 @@ class Browser:
             event_name: The CDP event type to listen for.
             handler: Callback function or coroutine to handle the event.
         """
-        self._handlers.setdefault(event_name, []).append(handler)
+        handlers = self._handlers.get(event_name)
+        if handlers is None:
+            handlers = self._handlers[event_name] = []
+        handlers.append((handler, asyncio.iscoroutinefunction(handler)))
 
     async def cookies(
         self,
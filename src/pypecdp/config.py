@@ -2,14 +2,88 @@
 
 from __future__ import annotations
 
+import atexit
+import concurrent.futures
+import functools
 import os
-import pathlib
 import shutil
 import tempfile
-from dataclasses import dataclass, field
+import types
+import uuid
+from collections.abc import Mapping, Sequence
+from dataclasses import dataclass
+from functools import cached_property
 
 from .logger import logger
 
+# Shared immutable defaults: the common no-extra-args / no-env case
+# skips allocating a fresh empty container per Config
+_NO_EXTRA_ARGS: tuple[str, ...] = ()
+_NO_ENV: Mapping[str, str] = types.MappingProxyType({})
+
+# Single worker that unlinks discarded profile directories off the
+# caller's path; see ensure_user_data_dir. Drained at interpreter exit
+# so trash directories are not left behind.
+_DELETE_POOL = concurrent.futures.ThreadPoolExecutor(
+    max_workers=1, thread_name_prefix="pypecdp-rmtree"
+)
+atexit.register(_DELETE_POOL.shutdown, wait=True)
+
+# Default Chrome arguments appended to every launch (unless ignored)
+_DEFAULT_ARGS: tuple[str, ...] = (
+    "--accept-lang=en-US",
+    "--no-first-run",
+    "--no-default-browser-check",
+    "--use-gl=angle",
+    "--use-angle=swiftshader",
+    "--disable-gpu",
+    "--disable-blink-features=AutomationControlled",
+    "--disable-features=IsolateOrigins,site-per-process",
+)
+
+
+class Argv(list[str]):
+    """Chrome argument list with a memoized prefix view.
+
+    Behaves exactly like a list of argument strings; `prefix_set`
+    additionally exposes the flag prefixes (the part before any "=")
+    as a frozenset, so membership checks like
+    ``"--user-data-dir" in argv.prefix_set`` are O(1) hash lookups
+    instead of linear substring scans.
+    """
+
+    @cached_property
+    def prefix_set(self) -> frozenset[str]:
+        """Frozenset of argument prefixes, computed on first access."""
+        return frozenset(arg.split("=", maxsplit=1)[0] for arg in self)
+
+
+@functools.lru_cache(maxsize=32)
+def _filtered_default_args(
+    ignore: tuple[str, ...],
+) -> tuple[str, ...]:
+    """Default arguments with the given ignore list applied.
+
+    Pure function of its input, so the result is memoized across Config
+    instances — distinct Configs with the same ignore list (retry
+    logic, test fixtures) share one filtered tuple instead of rerunning
+    the filter per instance.
+
+    Args:
+        ignore: Default args to drop, with or without "--" prefix.
+
+    Returns:
+        tuple[str, ...]: Filtered default arguments.
+    """
+    # Normalize once ("arg-name" and "--arg-name" both accepted), then
+    # filter with O(1) set membership instead of a nested scan
+    ignore_set = frozenset(arg.lstrip("-") for arg in ignore)
+    return tuple(
+        arg
+        for arg in _DEFAULT_ARGS
+        if arg.split("=", maxsplit=1)[0].lstrip("-") not in ignore_set
+    )
+
 
 @dataclass
 class Config:
@@ -26,6 +100,10 @@ class Config:
         extra_args: Additional command-line arguments to pass.
         ignore_default_args: List of default args to ignore.
         env: Environment variables to set for the browser process.
+        max_concurrent_sends: Maximum CDP commands in flight at once.
+            Bulk fan-outs (mass tab closes, batched domain enables)
+            are throttled to this many concurrent sends instead of
+            bursting the pipe all at once.
 
     Example:
         >>> config = Config(
@@ -39,9 +117,10 @@ class Config:
     user_data_dir: str | None = None
     clean_data_dir: bool = True
     headless: bool = True
-    extra_args: list[str] = field(default_factory=list)
+    extra_args: Sequence[str] = _NO_EXTRA_ARGS
     ignore_default_args: list[str] | None = None
-    env: dict[str, str] = field(default_factory=dict)
+    env: Mapping[str, str] = _NO_ENV
+    max_concurrent_sends: int = 16
 
     def ensure_user_data_dir(
         self,
@@ -58,14 +137,23 @@ class Config:
             data_dir = os.path.join(tempfile.gettempdir(), ".pypecdp-profile")
             self.user_data_dir = data_dir
         if self.clean_data_dir and os.path.exists(data_dir):
-            shutil.rmtree(data_dir)
-        pathlib.Path(data_dir).mkdir(parents=True, exist_ok=True)
+            # Rename is O(1) while the unlink walk is O(files); move the
+            # old profile aside and delete it in the background so
+            # launch does not wait on tens of thousands of unlinks.
+            trash = f"{data_dir}.trash.{uuid.uuid4().hex}"
+            try:
+                os.rename(data_dir, trash)
+            except OSError:
+                shutil.rmtree(data_dir)
+            else:
+                _DELETE_POOL.submit(shutil.rmtree, trash, ignore_errors=True)
+        os.makedirs(data_dir, exist_ok=True)
         logger.debug("Using user_data_dir: %s", data_dir)
         return data_dir
 
     def build_argv(
         self,
-    ) -> list[str]:
+    ) -> Argv:
         """Build command-line arguments for Chrome launch.
 
         Constructs the full argument list including headless mode,
@@ -73,61 +161,75 @@ class Config:
         Filters out arguments specified in ignore_default_args.
 
         Returns:
-            list[str]: Complete list of command-line arguments.
+            Argv: Complete list of command-line arguments; its
+                `prefix_set` supports O(1) flag membership checks.
         """
-        argv: list[str] = []
+        argv: Argv = Argv()
         if self.headless and "--headless=new" not in self.extra_args:
             argv.append("--headless=new")
         argv.append("--remote-debugging-pipe")
         argv.append(f"--user-data-dir={self.ensure_user_data_dir()}")
-        # Define default arguments
-        default_args = [
-            "--accept-lang=en-US",
-            "--no-first-run",
-            "--no-default-browser-check",
-            "--use-gl=angle",
-            "--use-angle=swiftshader",
-            "--disable-gpu",
-            "--disable-blink-features=AutomationControlled",
-            "--disable-features=IsolateOrigins,site-per-process",
-        ]
-        # Filter out ignored default args
-        if self.ignore_default_args:
-            filtered_args = []
-            for arg in default_args:
-                # Check if the arg (or its base without value) should be ignored
-                arg_base = arg.split("=", maxsplit=1)[0]
-                should_ignore = False
-                for ignore_arg in self.ignore_default_args:
-                    # Support both "arg-name" and "--arg-name" formats
-                    if arg_base in (ignore_arg, f"--{ignore_arg}"):
-                        should_ignore = True
-                        break
-                if not should_ignore:
-                    filtered_args.append(arg)
-            argv.extend(filtered_args)
-        else:
-            argv.extend(default_args)
+        # Default args with ignore_default_args applied (memoized)
+        argv.extend(self._static_args)
         # Append extra user args
         argv.extend(self.extra_args)
         argv.append("about:blank")
         logger.debug("Built Chrome argv: %s", argv)
         return argv
 
+    @cached_property
+    def _static_args(
+        self,
+    ) -> tuple[str, ...]:
+        """Default arguments with ignore_default_args applied.
+
+        Cached per instance on first use; the filtering itself is
+        memoized across instances in `_filtered_default_args`.
+
+        Returns:
+            tuple[str, ...]: Filtered default arguments.
+        """
+        if not self.ignore_default_args:
+            return _DEFAULT_ARGS
+        return _filtered_default_args(tuple(self.ignore_default_args))
+
+    @cached_property
+    def _env_snapshot(
+        self,
+    ) -> dict[str, str]:
+        """Copy of os.environ, taken on this Config's first build_env.
+
+        Cached per instance: a fresh Config always sees the current
+        environment, while repeat launches from the same Config skip
+        re-iterating os.environ.
+
+        Returns:
+            dict[str, str]: Snapshot of the process environment.
+        """
+        return dict(os.environ)
+
     def build_env(
         self,
     ) -> dict[str, str]:
         """Build environment variables for Chrome process.
 
-        Merges current environment with custom overrides.
+        Merges the process environment with custom overrides. The
+        os.environ copy is snapshotted once per Config instead of
+        re-iterated per call; use `refresh_env` after mutating the
+        environment.
 
         Returns:
             dict[str, str]: Complete environment variable mapping.
         """
-        env: dict[str, str] = dict(os.environ)
-        env.update(self.env)
+        env: dict[str, str] = {**self._env_snapshot, **self.env}
         logger.debug("Built child env overrides: %s", self.env)
         return env
 
+    def refresh_env(
+        self,
+    ) -> None:
+        """Drop this Config's os.environ snapshot used by `build_env`."""
+        self.__dict__.pop("_env_snapshot", None)
+
 
-__all__ = ["Config"]
+__all__ = ["Argv", "Config"]
@@ -3,8 +3,11 @@
 from __future__ import annotations
 
 import asyncio
-from dataclasses import dataclass
-from typing import TYPE_CHECKING, Any
+import logging
+import time
+from collections.abc import Iterable, Iterator, Sequence
+from dataclasses import dataclass, field
+from typing import TYPE_CHECKING, Any, Literal
 
 from . import cdp
 from .logger import logger
@@ -13,60 +16,125 @@ from .util import tab_attached
 if TYPE_CHECKING:
     from .tab import Tab
 
-
-@dataclass
+# CDP constructors used by the interaction hot paths, bound once at
+# import; call sites otherwise pay two module attribute lookups per
+# command (click/type fire several commands per action)
+_scroll_into_view_if_needed = cdp.dom.scroll_into_view_if_needed
+_focus = cdp.dom.focus
+_get_content_quads = cdp.dom.get_content_quads
+_get_outer_html = cdp.dom.get_outer_html
+_get_attributes = cdp.dom.get_attributes
+_query_selector = cdp.dom.query_selector
+_describe_node = cdp.dom.describe_node
+_resolve_node = cdp.dom.resolve_node
+_insert_text = cdp.input_.insert_text
+_call_function_on = cdp.runtime.call_function_on
+_CallArgument = cdp.runtime.CallArgument
+
+# Static skeleton for Input.dispatchMouseEvent payloads sent from click().
+# The press/release dispatches differ only in type/x/y/button/clickCount,
+# so the dict is templated once here and filled in per call.
+# Single-round-trip click preparation: scroll the element into view and
+# return its viewport center, replacing separate scrollIntoViewIfNeeded
+# and getContentQuads round-trips.
+_CLICK_PREP_JS = (
+    "function(){ this.scrollIntoViewIfNeeded();"
+    " const r = this.getBoundingClientRect();"
+    " return [r.left + r.width / 2, r.top + r.height / 2]; }"
+)
+
+# Event-driven selector wait: resolves true as soon as the selector
+# matches under the element, or false once the timeout elapses. Replaces
+# up to timeout/poll querySelector round-trips with a single one.
+_WAIT_SELECTOR_JS = (
+    "function(sel, timeout){ return new Promise(res => {"
+    " const q = () => this.querySelector(sel);"
+    " if (q()) { res(true); return; }"
+    " const mo = new MutationObserver(() => {"
+    " if (q()) { mo.disconnect(); res(true); } });"
+    " mo.observe(this, {childList: true, subtree: true, attributes: true});"
+    " setTimeout(() => { mo.disconnect(); res(false); }, timeout); }); }"
+)
+
+# How long a successful scroll_into_view stays fresh; back-to-back
+# interactions with the same element within this window skip the
+# redundant scroll round-trip
+_SCROLL_TTL = 0.1
+
+_MOUSE_EVENT_PARAMS: dict[str, Any] = {
+    "type": "mousePressed",
+    "x": 0.0,
+    "y": 0.0,
+    "button": "left",
+    "clickCount": 1,
+}
+
+
+@dataclass(slots=True, frozen=True)
 class Position:
     """Container for element coordinates.
 
     Quad format from CDP is [x1, y1, x2, y2, x3, y3, x4, y4]
-    where points are ordered: top-left, top-right, bottom-right, bottom-left
+    where points are ordered: top-left, top-right, bottom-right,
+    bottom-left. Corners, center and extent are computed once at
+    construction, so repeated reads are plain attribute loads instead
+    of per-access quad indexing.
+
+    Attributes:
+        quad: The source CDP quad coordinates.
+        top_left: Top-left corner coordinates (x, y).
+        top_right: Top-right corner coordinates (x, y).
+        bottom_right: Bottom-right corner coordinates (x, y).
+        bottom_left: Bottom-left corner coordinates (x, y).
+        center: Center point coordinates (x, y).
+        width: Width of the element.
+        height: Height of the element.
     """
 
     quad: cdp.dom.Quad
-
-    @property
-    def top_left(self) -> tuple[float, float]:
-        """Top-left corner coordinates (x, y)."""
-        return (self.quad[0], self.quad[1])
-
-    @property
-    def top_right(self) -> tuple[float, float]:
-        """Top-right corner coordinates (x, y)."""
-        return (self.quad[2], self.quad[3])
-
-    @property
-    def bottom_right(self) -> tuple[float, float]:
-        """Bottom-right corner coordinates (x, y)."""
-        return (self.quad[4], self.quad[5])
-
-    @property
-    def bottom_left(self) -> tuple[float, float]:
-        """Bottom-left corner coordinates (x, y)."""
-        return (self.quad[6], self.quad[7])
-
-    @property
-    def center(self) -> tuple[float, float]:
-        """Center point coordinates (x, y)."""
-        xs = [self.quad[0], self.quad[2], self.quad[4], self.quad[6]]
-        ys = [self.quad[1], self.quad[3], self.quad[5], self.quad[7]]
-        return (sum(xs) / 4.0, sum(ys) / 4.0)
-
-    @property
-    def width(self) -> float:
-        """Width of the element."""
-        return float(abs(self.quad[2] - self.quad[0]))
-
-    @property
-    def height(self) -> float:
-        """Height of the element."""
-        return float(abs(self.quad[5] - self.quad[1]))
+    top_left: tuple[float, float] = field(init=False, repr=False)
+    top_right: tuple[float, float] = field(init=False, repr=False)
+    bottom_right: tuple[float, float] = field(init=False, repr=False)
+    bottom_left: tuple[float, float] = field(init=False, repr=False)
+    center: tuple[float, float] = field(init=False, repr=False)
+    width: float = field(init=False, repr=False)
+    height: float = field(init=False, repr=False)
+
+    def __post_init__(self) -> None:
+        q = self.quad
+        # object.__setattr__ is the sanctioned way to populate derived
+        # fields on a frozen dataclass
+        set_ = object.__setattr__
+        set_(self, "top_left", (q[0], q[1]))
+        set_(self, "top_right", (q[2], q[3]))
+        set_(self, "bottom_right", (q[4], q[5]))
+        set_(self, "bottom_left", (q[6], q[7]))
+        set_(
+            self,
+            "center",
+            (
+                (q[0] + q[2] + q[4] + q[6]) * 0.25,
+                (q[1] + q[3] + q[5] + q[7]) * 0.25,
+            ),
+        )
+        set_(self, "width", float(abs(q[2] - q[0])))
+        set_(self, "height", float(abs(q[5] - q[1])))
 
     def __repr__(self) -> str:
         """String representation of Position."""
-        return f"Position(center={self.center}, width={self.width:.1f}, height={self.height:.1f})"
+        cx, cy = self.center
+        return "Position(center=(%.1f, %.1f), width=%.1f, height=%.1f)" % (
+            cx,
+            cy,
+            self.width,
+            self.height,
+        )
 
 
-@dataclass
+# Slots: a page can yield thousands of Elems, so dropping the per-
+# instance __dict__ cuts their footprint roughly in half. weakref_slot
+# keeps them storable in Tab's weak-value elem cache.
+@dataclass(slots=True, weakref_slot=True)
 class Elem:
     """Wrapper for DOM elements with interaction methods.
 
@@ -78,12 +146,28 @@ class Elem:
         node: The CDP Node object representing the DOM element.
 
     Note:
-        Additional node properties like node_id and backend_node_id
-        are accessible via __getattr__ delegation to the node object.
+        Common node properties (node_id, backend_node_id, parent_id,
+        node_name) are forwarded via explicit properties; any other
+        node attribute is accessible via __getattr__ delegation.
     """
 
     tab: Tab
     node: cdp.dom.Node
+    _attrs_cache: dict[str, str] | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    _remote_obj: cdp.runtime.RemoteObject | None = field(
+        default=None, init=False, repr=False, compare=False
+    )
+    # Memoized parent wrapper; False means "not resolved yet" since
+    # None is a valid result (root elements have no parent)
+    _parent_cache: Elem | None | Literal[False] = field(
+        default=False, init=False, repr=False, compare=False
+    )
+    # monotonic timestamp of the last successful scroll_into_view
+    _scrolled_at: float = field(
+        default=0.0, init=False, repr=False, compare=False
+    )
 
     @tab_attached
     async def scroll_into_view(
@@ -91,26 +175,38 @@ class Elem:
     ) -> None:
         """Scroll element into viewport and attempt to focus it.
 
-        Errors are suppressed if the element is detached or hidden.
+        Errors are suppressed if the element is detached or hidden. A
+        scroll performed within the last `_SCROLL_TTL` seconds is
+        considered still valid and skipped, so adjacent interactions
+        (click then type) pay for one scroll round-trip, not two; call
+        `invalidate_position` after layout-changing actions.
 
         Raises:
             ReferenceError: If the tab session is no longer active.
         """
         if not self.backend_node_id:
-            logger.debug("%s has no backend_node_id to scroll into view", self)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "%s has no backend_node_id to scroll into view", self
+                )
+            return None
+        if time.monotonic() - self._scrolled_at < _SCROLL_TTL:
             return None
         try:
             await self.tab.send(
-                cdp.dom.scroll_into_view_if_needed(
+                _scroll_into_view_if_needed(
                     backend_node_id=self.backend_node_id,
                 )
             )
+            self._scrolled_at = time.monotonic()
         except RuntimeError as e:
             # Node may be detached or hidden, continue anyway
-            logger.debug(
-                "Could not scroll node %s into view", self.backend_node_id
-            )
-            logger.debug("Scroll error: %s", e)
+            self.invalidate()
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Could not scroll node %s into view", self.backend_node_id
+                )
+                logger.debug("Scroll error: %s", e)
 
     @tab_attached
     async def focus(
@@ -124,18 +220,21 @@ class Elem:
             ReferenceError: If the tab session is no longer active.
         """
         if not self.backend_node_id:
-            logger.debug("%s has no backend_node_id to focus", self)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s has no backend_node_id to focus", self)
             return None
         try:
             await self.tab.send(
-                cdp.dom.focus(
+                _focus(
                     backend_node_id=self.backend_node_id,
                 )
             )
+            self.tab._last_focused_backend = int(self.backend_node_id)
         except RuntimeError as e:
             # Node may not be focusable, continue anyway
-            logger.debug("Could not focus node %s", self.backend_node_id)
-            logger.debug("Focus error: %s", e)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("Could not focus node %s", self.backend_node_id)
+                logger.debug("Focus error: %s", e)
 
     @tab_attached
     async def position(
@@ -150,16 +249,18 @@ class Elem:
             ReferenceError: If the tab session is no longer active.
         """
         if not self.backend_node_id:
-            logger.debug("%s has no backend_node_id to get position", self)
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug("%s has no backend_node_id to get position", self)
             return None
         quads: list[cdp.dom.Quad] = await self.tab.send(
-            cdp.dom.get_content_quads(
+            _get_content_quads(
                 backend_node_id=self.backend_node_id,
             )
         )
         if quads:
             return Position(quad=quads[0])
-        logger.debug("No quads returned for node %s", self.backend_node_id)
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug("No quads returned for node %s", self.backend_node_id)
         return None
 
     @tab_attached
@@ -171,9 +272,11 @@ class Elem:
     ) -> Tab | None:
         """Click the element at its center point.
 
-        Scrolls the element into view, calculates the center, and
-        dispatches mouse press and release events. Returns the top-level
-        tab, which is useful when the click triggers navigation.
+        Scrolls the element into view and computes its center in a
+        single JS round-trip (falling back to the CDP DOM commands if
+        the node cannot be resolved), then dispatches mouse press and
+        release events. Returns the top-level tab, which is useful when
+        the click triggers navigation.
 
         Args:
             button: Mouse button to use (default: LEFT).
@@ -194,40 +297,58 @@ class Elem:
             ...     await current_tab.wait_for_event(cdp.page.LoadEventFired)
             ...     print(f"Navigated to: {current_tab.url}")
         """
-        await self.scroll_into_view()
-        position = await self.position()
-        if not position:
-            logger.debug(
-                "Could not get position for node %s", self.backend_node_id
-            )
-            return None
-        x, y = position.center
-        await self.tab.send(
-            cdp.input_.dispatch_mouse_event(
-                type_="mousePressed",
-                x=x,
-                y=y,
-                button=button,
-                click_count=click_count,
-            )
+        center: tuple[float, float] | None = None
+        obj = await self._resolve_object()
+        if obj and obj.object_id:
+            try:
+                res, _ = await self.tab.send(
+                    _call_function_on(
+                        object_id=obj.object_id,
+                        function_declaration=_CLICK_PREP_JS,
+                        return_by_value=True,
+                    )
+                )
+                if res.value:
+                    center = (res.value[0], res.value[1])
+            except RuntimeError as e:
+                # Fall back to the CDP DOM path below
+                self.invalidate()
+                logger.debug("Click prep JS failed: %s", e)
+        if center is None:
+            await self.scroll_into_view()
+            position = await self.position()
+            if not position:
+                if logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Could not get position for node %s",
+                        self.backend_node_id,
+                    )
+                return None
+            center = position.center
+        x, y = center
+        params = dict(_MOUSE_EVENT_PARAMS)
+        params["x"] = x
+        params["y"] = y
+        params["button"] = button.to_json()
+        params["clickCount"] = click_count
+        release_params = dict(params)
+        release_params["type"] = "mouseReleased"
+        # Write the press while sleeping so its round-trip hides under
+        # the inter-click delay; the pipe is FIFO so ordering holds.
+        press = asyncio.ensure_future(
+            self.tab.send_raw("Input.dispatchMouseEvent", params)
         )
         await asyncio.sleep(delay)
-        await self.tab.send(
-            cdp.input_.dispatch_mouse_event(
-                type_="mouseReleased",
-                x=x,
-                y=y,
-                button=button,
-                click_count=click_count,
-            )
+        await asyncio.gather(
+            press,
+            self.tab.send_raw("Input.dispatchMouseEvent", release_params),
         )
-        tab = self.tab
-        while True:
-            parent = tab.parent
-            if parent is None:
-                break
-            tab = parent
-        return tab
+        # The click moved the browser's focus (to this element or, for
+        # non-focusable targets, an ancestor), so the tracked focus is
+        # stale; drop it rather than guess, and let the next type()
+        # re-issue DOM.focus.
+        self.tab._last_focused_backend = None
+        return self.tab.root
 
     @tab_attached
     async def type(
@@ -237,6 +358,9 @@ class Elem:
         """Type text into the element.
 
         Focuses the element and inserts the text via CDP input command.
+        The focus round-trip is skipped when this element was the last
+        one focused on the tab (e.g. repeated type() calls on the same
+        field).
 
         Args:
             text: The text string to type.
@@ -245,8 +369,11 @@ class Elem:
             ReferenceError: If the tab session is no longer active.
         """
         await self.scroll_into_view()
-        await self.focus()
-        await self.tab.send(cdp.input_.insert_text(text=text))
+        if not self.backend_node_id or self.tab._last_focused_backend != int(
+            self.backend_node_id
+        ):
+            await self.focus()
+        await self.tab.send(_insert_text(text=text))
 
     @tab_attached
     async def set_value(
@@ -272,10 +399,10 @@ class Elem:
         obj = await self._resolve_object()
         if obj and obj.object_id:
             await self.tab.send(
-                cdp.runtime.call_function_on(
+                _call_function_on(
                     object_id=obj.object_id,
                     function_declaration="function(v){ this.value = v; this.dispatchEvent(new Event('input', {bubbles:true})); }",
-                    arguments=[cdp.runtime.CallArgument(value=value)],
+                    arguments=[_CallArgument(value=value)],
                     await_promise=True,
                 )
             )
@@ -297,7 +424,7 @@ class Elem:
         obj = await self._resolve_object()
         if obj and obj.object_id:
             res, _ = await self.tab.send(
-                cdp.runtime.call_function_on(
+                _call_function_on(
                     object_id=obj.object_id,
                     function_declaration="function(){ return this.textContent || ''; }",
                     await_promise=True,
@@ -324,13 +451,65 @@ class Elem:
             ReferenceError: If the tab session is no longer active.
         """
         res = await self.tab.send(
-            cdp.dom.get_outer_html(
+            _get_outer_html(
                 backend_node_id=self.backend_node_id,
                 include_shadow_dom=include_shadow_dom,
             )
         )
         return res
 
+    @tab_attached
+    async def attributes(
+        self,
+    ) -> dict[str, str]:
+        """Get all attributes of the element as a dict.
+
+        The flat name/value list from DOM.getAttributes is fetched once
+        and cached per Elem, so reading multiple attributes costs a
+        single round-trip. Call `invalidate_attrs()` after mutating the
+        DOM to force a refetch.
+
+        Returns:
+            dict[str, str]: Mapping of attribute names to values.
+
+        Raises:
+            ReferenceError: If the tab session is no longer active.
+        """
+        if self._attrs_cache is None:
+            attrs = await self.tab.send(_get_attributes(node_id=self.node_id))
+            attrs_list: list[str] = list(attrs)
+            self._attrs_cache = dict(zip(attrs_list[0::2], attrs_list[1::2]))
+        return self._attrs_cache
+
+    def invalidate_attrs(
+        self,
+    ) -> None:
+        """Drop the cached attribute dict so the next read refetches."""
+        self._attrs_cache = None
+
+    def invalidate_position(
+        self,
+    ) -> None:
+        """Forget the last scroll so the next interaction re-scrolls.
+
+        Call after actions that change layout (resizes, collapsing
+        sections) within the scroll freshness window.
+        """
+        self._scrolled_at = 0.0
+
+    def invalidate(
+        self,
+    ) -> None:
+        """Drop all per-element caches (attributes, resolved object).
+
+        Called internally when the node appears detached; can also be
+        called by users after DOM mutations that affect this element.
+        """
+        self._attrs_cache = None
+        self._remote_obj = None
+        self._parent_cache = False
+        self._scrolled_at = 0.0
+
     @tab_attached
     async def attribute(
         self,
@@ -347,14 +526,8 @@ class Elem:
         Raises:
             ReferenceError: If the tab session is no longer active.
         """
-        attrs = await self.tab.send(
-            cdp.dom.get_attributes(node_id=self.node_id)
-        )
-        attrs_list: list[str] = list(attrs)
-        for i in range(0, len(attrs_list), 2):
-            if attrs_list[i] == name:
-                return attrs_list[i + 1]
-        return None
+        attrs = await self.attributes()
+        return attrs.get(name)
 
     @tab_attached
     async def query_selector(
@@ -373,14 +546,14 @@ class Elem:
             ReferenceError: If the tab session is no longer active.
         """
         res = await self.tab.send(
-            cdp.dom.query_selector(
+            _query_selector(
                 node_id=self.node_id,
                 selector=selector,
             )
         )
         if res:
-            node = await self.tab.send(cdp.dom.describe_node(node_id=res))
-            return Elem(tab=self.tab, node=node)
+            node = await self.tab.send(_describe_node(node_id=res))
+            return self.tab._make_elem(node)
         return None
 
     @tab_attached
@@ -392,10 +565,15 @@ class Elem:
     ) -> Elem | None:
         """Wait for a child element matching the selector to appear.
 
+        Installs a MutationObserver in the page that resolves as soon as
+        the selector matches, avoiding per-poll CDP round-trips. Falls
+        back to polling if the node cannot be resolved to a
+        RemoteObject.
+
         Args:
             selector: CSS selector string.
             timeout: Maximum seconds to wait.
-            poll: Polling interval in seconds.
+            poll: Polling interval in seconds (fallback path only).
 
         Returns:
             Elem | None: The matching element, or None if timeout.
@@ -403,12 +581,43 @@ class Elem:
         Raises:
             ReferenceError: If the tab session is no longer active.
         """
-        end: float = asyncio.get_running_loop().time() + timeout
-        while asyncio.get_running_loop().time() < end:
+        if timeout <= 0:
+            # Nothing to wait for; a single query settles it without
+            # installing an observer or scheduling a timeout.
+            return await self.query_selector(selector)
+        obj = await self._resolve_object()
+        if obj and obj.object_id:
+            try:
+                res, _ = await self.tab.send(
+                    _call_function_on(
+                        object_id=obj.object_id,
+                        function_declaration=_WAIT_SELECTOR_JS,
+                        arguments=[
+                            _CallArgument(value=selector),
+                            _CallArgument(value=int(timeout * 1000)),
+                        ],
+                        await_promise=True,
+                        return_by_value=True,
+                    )
+                )
+                if res.value:
+                    return await self.query_selector(selector)
+                return None
+            except RuntimeError as e:
+                # Fall back to the polling path below
+                logger.debug("MutationObserver wait failed: %s", e)
+        loop = asyncio.get_running_loop()
+        end: float = loop.time() + timeout
+        # Exponential backoff capped at the user's poll interval: the
+        # first re-probe is near-immediate for fast-appearing elements
+        # while long waits settle at the configured rate.
+        interval: float = min(poll, 0.02)
+        while loop.time() < end:
             el: Elem | None = await self.query_selector(selector)
             if el:
                 return el
-            await asyncio.sleep(poll)
+            await asyncio.sleep(interval)
+            interval = min(interval * 1.5, poll)
         return None
 
     @tab_attached
@@ -417,6 +626,10 @@ class Elem:
     ) -> cdp.runtime.RemoteObject | None:
         """Resolve the DOM node to a CDP RemoteObject.
 
+        The resolved object is cached per Elem so consecutive JS calls
+        (set_value, text, click) share one resolve round-trip; the cache
+        is dropped via `invalidate()` when the node looks detached.
+
         Returns:
             RemoteObject | None: The resolved object, or None if the
                 node cannot be resolved.
@@ -424,23 +637,63 @@ class Elem:
         Raises:
             ReferenceError: If the tab session is no longer active.
         """
+        if self._remote_obj is not None:
+            return self._remote_obj
         try:
             res: cdp.runtime.RemoteObject = await self.tab.send(
-                cdp.dom.resolve_node(
+                _resolve_node(
                     backend_node_id=self.backend_node_id,
                 )
             )
+            self._remote_obj = res
             return res
         except RuntimeError:
             # Node cannot be resolved (detached, in different context, etc.)
-            logger.debug(
-                "Could not resolve node %s to RemoteObject",
-                self.backend_node_id,
-            )
+            self._remote_obj = None
+            if logger.isEnabledFor(logging.DEBUG):
+                logger.debug(
+                    "Could not resolve node %s to RemoteObject",
+                    self.backend_node_id,
+                )
             return None
 
     # Attributes--------------------------------------------------------------
 
+    @property
+    def node_id(
+        self,
+    ) -> cdp.dom.NodeId:
+        """NodeId of the wrapped DOM node."""
+        return self.node.node_id
+
+    @property
+    def backend_node_id(
+        self,
+    ) -> cdp.dom.BackendNodeId:
+        """BackendNodeId of the wrapped DOM node."""
+        return self.node.backend_node_id
+
+    @property
+    def parent_id(
+        self,
+    ) -> cdp.dom.NodeId | None:
+        """NodeId of the parent node, if any."""
+        return self.node.parent_id
+
+    @property
+    def node_name(
+        self,
+    ) -> str:
+        """Node name of the wrapped DOM node (e.g. "DIV")."""
+        return self.node.node_name
+
+    @property
+    def node_type(
+        self,
+    ) -> int:
+        """Node type of the wrapped DOM node (e.g. 1 for elements)."""
+        return self.node.node_type
+
     @property
     def parent(
         self,
@@ -458,13 +711,20 @@ class Elem:
             while form and form.node_name != "FORM":
                 form = form.parent
 
+        The result is memoized per element — ancestor chains resolve
+        each unique node once — and dropped by `invalidate`.
+
         Returns:
             Elem | None: The parent Elem, or None if this is a root element
                 (no parent_id) or if the parent is the document root.
         """
+        cached = self._parent_cache
+        if cached is not False:
+            return cached
         parent: Elem | None = None
         if self.node.parent_id:
             parent = self.tab.elem(node_id=self.node.parent_id)
+        self._parent_cache = parent
         return parent
 
     def __repr__(
@@ -483,6 +743,10 @@ class Elem:
     ) -> Any:
         """Delegate attribute access to node attributes.
 
+        Common node attributes (node_id, backend_node_id, parent_id,
+        node_name) are forwarded via explicit properties above and never
+        reach this slow path; this fallback covers the rarer ones.
+
         Args:
             name: The attribute name to access.
         Returns:
@@ -490,9 +754,82 @@ class Elem:
         Raises:
             AttributeError: If the attribute is not found.
         """
-        if self.node and hasattr(self.node, name):
+        try:
             return getattr(self.node, name)
-        raise AttributeError(f"'Elem' object has no attribute '{name}'")
+        except AttributeError:
+            raise AttributeError(
+                f"'Elem' object has no attribute '{name}'"
+            ) from None
+
+
+class ElemBatch(Sequence["Elem"]):
+    """Lazy sequence of elements sharing one tab reference.
+
+    Holds a single tuple of NodeIds instead of N eagerly-built Elem
+    wrappers; items are resolved through `Tab.elem` (and its node index
+    and element cache) only when accessed. For a search matching
+    thousands of nodes this cuts the up-front allocations to one object.
+
+    Attributes:
+        tab: The Tab the node ids belong to.
+        node_ids: Tuple of matched NodeIds, in document order.
+    """
+
+    __slots__ = ("tab", "node_ids")
+
+    def __init__(
+        self,
+        tab: Tab,
+        node_ids: Iterable[cdp.dom.NodeId],
+    ) -> None:
+        """Initialize the batch.
+
+        Args:
+            tab: The Tab the node ids belong to.
+            node_ids: NodeIds to expose as elements.
+        """
+        self.tab = tab
+        self.node_ids = tuple(node_ids)
+
+    def __len__(
+        self,
+    ) -> int:
+        """Get the number of matched nodes."""
+        return len(self.node_ids)
+
+    def __getitem__(
+        self,
+        index: Any,
+    ) -> Any:
+        """Resolve the element (or sub-batch for slices) at an index.
+
+        Args:
+            index: Integer index or slice.
+
+        Returns:
+            Elem | ElemBatch: The resolved element, or a new batch for
+                slice indices.
+        """
+        if isinstance(index, slice):
+            return ElemBatch(self.tab, self.node_ids[index])
+        return self.tab.elem(self.node_ids[index])
+
+    def __iter__(
+        self,
+    ) -> Iterator[Elem]:
+        """Yield elements lazily in document order."""
+        for node_id in self.node_ids:
+            yield self.tab.elem(node_id)
+
+    def __repr__(
+        self,
+    ) -> str:
+        """Get a string representation of the batch.
+
+        Returns:
+            str: String representation of the ElemBatch.
+        """
+        return f"<ElemBatch len={len(self.node_ids)}>"
 
 
-__all__ = ["Elem", "Position"]
+__all__ = ["Elem", "ElemBatch", "Position"]
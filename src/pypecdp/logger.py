@@ -28,17 +28,20 @@ def get_logger() -> logging.Logger:
     name = os.environ.get("PYPECDP_LOGGER", "pypecdp")
     level = os.environ.get("PYPECDP_LOGLEVEL", "INFO").upper()
     new_logger = logging.getLogger(name)
-    fmt = "%(asctime)s [%(process)d][%(levelname)s] %(message)s"
-    formatter = logging.Formatter(fmt, "%b %d %I:%M:%S")
+    # Idempotent: repeat calls return the already configured logger
+    if getattr(new_logger, "_pypecdp_configured", False):
+        return new_logger
     new_logger.setLevel(level)
-    # Remove any existing handlers to avoid duplicates
-    for handler in new_logger.handlers:
-        new_logger.removeHandler(handler)
-    # Add default StreamHandler for console output
-    handler = logging.StreamHandler()
-    handler.setLevel(level)
-    handler.setFormatter(formatter)
-    new_logger.addHandler(handler)
+    # Add default StreamHandler for console output, preserving any
+    # handlers the user installed before us
+    if not new_logger.handlers:
+        fmt = "%(asctime)s [%(process)d][%(levelname)s] %(message)s"
+        formatter = logging.Formatter(fmt, "%b %d %I:%M:%S")
+        handler = logging.StreamHandler()
+        handler.setLevel(level)
+        handler.setFormatter(formatter)
+        new_logger.addHandler(handler)
+    new_logger._pypecdp_configured = True
     return new_logger
 
 
@@ -4,15 +4,65 @@ from __future__ import annotations
 
 import asyncio
 import contextlib
+import json
+import logging
+import weakref
+from collections.abc import Sequence
 from typing import TYPE_CHECKING, Any, Callable
 
 from . import cdp
-from .elem import Elem
+from .elem import Elem, ElemBatch, Position
 from .logger import logger
 
 if TYPE_CHECKING:
     from .browser import Browser
 
+# Events that invalidate the cached document node (see handle_event)
+_DOC_INVALIDATING_EVENTS: tuple[type[Any], ...] = (
+    cdp.dom.DocumentUpdated,
+    cdp.page.FrameNavigated,
+    cdp.page.LoadEventFired,
+)
+
+# Events that signal a DOM change worth re-running a pending selector
+# wait for (see wait_for_elems)
+_DOM_CHANGE_EVENTS: tuple[type[Any], ...] = (
+    cdp.dom.DocumentUpdated,
+    cdp.dom.ChildNodeInserted,
+    cdp.dom.AttributeModified,
+    cdp.page.LoadEventFired,
+)
+
+
+# Selector function evaluated once per tab and reused through its
+# RemoteObject handle; the constant trampolines below hit V8's code
+# cache so repeated queries skip selector-expression compilation
+_QSA_FN_JS = "(s) => document.querySelectorAll(s)"
+_QSA_ALL_CALL_JS = "function(s){ return this(s); }"
+_QSA_FIRST_CALL_JS = "function(s){ return this(s)[0] || null; }"
+
+# Document-level MutationObserver wait; resolves true as soon as the
+# selector matches, false when the deadline passes. Interpolated with
+# (json-quoted selector, timeout in ms).
+_WAIT_DOC_SELECTOR_JS = (
+    "new Promise((resolve) => {"
+    " const q = () => document.querySelector(%s);"
+    " if (q()) return resolve(true);"
+    " const mo = new MutationObserver(() => {"
+    "  if (q()) { mo.disconnect(); resolve(true); }"
+    " });"
+    " mo.observe(document, {childList: true, subtree: true,"
+    " attributes: true});"
+    " setTimeout(() => { mo.disconnect(); resolve(false); }, %d);"
+    "})"
+)
+
+
+def _log_task_error(task: asyncio.Task[Any]) -> None:
+    """Consume a fire-and-forget task's result, logging any failure."""
+    if not task.cancelled() and task.exception() is not None:
+        logger.debug("Background task failed: %s", task.exception())
+
 
 class Tab:
     """Represents a browser tab/target with CDP session.
@@ -34,6 +84,26 @@ class Tab:
     # Class attribute for customization - subclasses can override
     elem_class: type[Elem] = Elem
 
+    # Slots shrink per-tab memory (every iframe target gets a Tab) and
+    # speed attribute access by skipping the instance __dict__
+    __slots__ = (
+        "browser",
+        "target_id",
+        "session_id",
+        "doc",
+        "_root",
+        "_target_info",
+        "_doc_cache",
+        "_node_index",
+        "_qsa_fn",
+        "_handlers",
+        "_once_handlers",
+        "_frameid",
+        "_elem_cache",
+        "_last_focused_backend",
+        "_load_event",
+    )
+
     def __init__(
         self,
         browser: Browser,
@@ -49,11 +119,36 @@ class Tab:
         """
         self.browser: Browser = browser
         self.target_id: cdp.target.TargetID = target_id
-        self.target_info: cdp.target.TargetInfo | None = target_info
+        self._root: Tab | None = None
+        self.target_info = target_info
         self.session_id: cdp.target.SessionID | None = None
         self.doc: cdp.dom.Node | None = None
-        self._handlers: dict[type[Any], list[Callable[[Any], Any]]] = {}
+        self._doc_cache: dict[tuple[int, bool], cdp.dom.Node] = {}
+        # node_id -> node map over self.doc, built lazily by elem() so
+        # repeated lookups skip re-walking the tree
+        self._node_index: dict[cdp.dom.NodeId, cdp.dom.Node] | None = None
+        # Cached handle to the evaluated querySelectorAll function
+        self._qsa_fn: cdp.runtime.RemoteObject | None = None
+        # Handlers are stored as (callable, is_coroutine) pairs so
+        # dispatch does not re-introspect each handler per event
+        self._handlers: dict[
+            type[Any], list[tuple[Callable[[Any], Any], bool]]
+        ] = {}
+        # One-shot handlers, popped wholesale on first dispatch. The
+        # inner dict keeps insertion order while letting a timed-out
+        # waiter unregister itself with an O(1) pop instead of a linear
+        # list.remove scan.
+        self._once_handlers: dict[
+            type[Any], dict[tuple[Callable[[Any], Any], bool], None]
+        ] = {}
         self._frameid: cdp.page.FrameId | None = None
+        self._elem_cache: weakref.WeakValueDictionary[int, Elem] = (
+            weakref.WeakValueDictionary()
+        )
+        self._last_focused_backend: int | None = None
+        # Long-lived load signal set structurally by handle_event, so
+        # navigate() never registers throwaway per-call handlers
+        self._load_event: asyncio.Event = asyncio.Event()
 
     async def send(
         self,
@@ -79,6 +174,33 @@ class Tab:
             **kwargs,
         )
 
+    async def send_raw(
+        self,
+        method: str,
+        params: dict[str, Any] | None = None,
+    ) -> dict[str, Any]:
+        """Send a pre-built CDP command within this tab's session.
+
+        Bypasses the typed command layer; see `Browser.send_raw`.
+
+        Args:
+            method: CDP method name (e.g. "Input.dispatchMouseEvent").
+            params: Optional parameter dict, serialized as-is.
+
+        Returns:
+            dict[str, Any]: The raw (unparsed) result dict.
+
+        Raises:
+            RuntimeError: If the tab is not attached or command fails.
+        """
+        if not self.session_id:
+            raise RuntimeError(f"Tab {self.target_id} not attached")
+        return await self.browser.send_raw(
+            method,
+            params,
+            session_id=self.session_id,
+        )
+
     def on(
         self,
         event_name: type[Any],
@@ -90,7 +212,33 @@ class Tab:
             event_name: The CDP event type to listen for.
             handler: Callback function or coroutine to handle events.
         """
-        self._handlers.setdefault(event_name, []).append(handler)
+        is_coro = asyncio.iscoroutinefunction(handler)
+        # get-then-insert instead of setdefault: no throwaway empty list
+        # allocated when the event type is already registered
+        handlers = self._handlers.get(event_name)
+        if handlers is None:
+            handlers = self._handlers[event_name] = []
+        handlers.append((handler, is_coro))
+
+    def once(
+        self,
+        event_name: type[Any],
+        handler: Callable[[Any], Any],
+    ) -> None:
+        """Register a handler that fires at most once.
+
+        All one-shot handlers for an event are removed together when the
+        event first fires, avoiding a linear list.remove per waiter.
+
+        Args:
+            event_name: The CDP event type to listen for.
+            handler: Callback function or coroutine to handle the event.
+        """
+        is_coro = asyncio.iscoroutinefunction(handler)
+        waiters = self._once_handlers.get(event_name)
+        if waiters is None:
+            waiters = self._once_handlers[event_name] = {}
+        waiters[(handler, is_coro)] = None
 
     async def handle_event(
         self,
@@ -102,23 +250,61 @@ class Tab:
             event: The CDP event object to dispatch.
         """
         method: type[Any] = type(event)
-        if method in (cdp.dom.DocumentUpdated,):
-            # Invalidate cached document on DOM changes
+        if method in _DOC_INVALIDATING_EVENTS:
+            # Invalidate cached document, elements and focus tracking on
+            # DOM changes / navigation
             self.doc = None
-        for h in self._handlers.get(method, []):
+            self._doc_cache.clear()
+            self._node_index = None
+            self._qsa_fn = None
+            self._elem_cache.clear()
+            self._last_focused_backend = None
+        elif method in _DOM_CHANGE_EVENTS:
+            # Any DOM mutation leaves the cached document snapshot and
+            # its node index behind the live tree, and a later search
+            # would hand back NodeIds the stale index cannot resolve.
+            # Remote handles and element wrappers stay valid, so only
+            # the snapshot state is dropped.
+            self.doc = None
+            self._doc_cache.clear()
+            self._node_index = None
+        if method is cdp.page.LoadEventFired:
+            self._load_event.set()
+        once = self._once_handlers.pop(method, ())
+        coros = []
+        for h, is_coro in (*once, *self._handlers.get(method, ())):
             try:
-                if asyncio.iscoroutinefunction(h) or asyncio.iscoroutine(h):
-                    await h(event)
+                if is_coro:
+                    coros.append(h(event))
                 else:
                     h(event)
             except Exception:
                 logger.exception("Tab handler error for %s", method)
+        if not coros:
+            return
+        if len(coros) == 1:
+            # Common single-listener case: await in place, no gather
+            # machinery or extra task scheduling
+            try:
+                await coros[0]
+            except Exception:
+                logger.exception("Tab handler error for %s", method)
+            return
+        # Multiple async listeners run concurrently; one slow handler no
+        # longer serializes the rest of the dispatch
+        results = await asyncio.gather(*coros, return_exceptions=True)
+        for result in results:
+            if isinstance(result, Exception):
+                logger.error(
+                    "Tab handler error for %s", method, exc_info=result
+                )
 
     def clear_handlers(
         self,
     ) -> None:
         """Clear all registered event handlers for this tab."""
         self._handlers.clear()
+        self._once_handlers.clear()
 
     async def attach(
         self,
@@ -160,16 +346,18 @@ class Tab:
             timeout: Maximum seconds to wait for load event. Set to 0
                 to skip waiting.
         """
+        # Clear-then-wait on the persistent load signal instead of
+        # registering a one-shot handler + future per navigation
+        self._load_event.clear()
         self._frameid, *_ = await self.send(
             cdp.page.navigate(
                 url=url,
             ),
         )
         if timeout > 0:
-            await self.wait_for_event(
-                event=cdp.page.LoadEventFired,
-                timeout=timeout,
-            )
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(timeout):
+                    await self._load_event.wait()
 
     async def wait_for_event(
         self,
@@ -183,22 +371,31 @@ class Tab:
             timeout: Maximum seconds to wait. Timeout errors are
                 suppressed.
         """
+        if timeout <= 0:
+            # Nothing can fire in zero time; skip the future + handler
+            # registration and the timeout scheduling entirely.
+            return
         fut: asyncio.Future[None] = asyncio.get_running_loop().create_future()
 
-        async def on_loaded(_: Any) -> None:
+        def on_loaded(_: Any) -> None:
             if not fut.done():
                 fut.set_result(None)
             logger.debug("Event %s fired for tab %s", event.__name__, self)
-            # remove once fired
-            handlers: list[Callable[[Any], Any]] = self._handlers.get(
-                event, []
-            )
-            if on_loaded in handlers:
-                handlers.remove(on_loaded)
 
-        self.on(event, on_loaded)
-        with contextlib.suppress(asyncio.TimeoutError):
-            await asyncio.wait_for(fut, timeout=timeout)
+        self.once(event, on_loaded)
+        # asyncio.timeout awaits the future in place, avoiding the extra
+        # task wrap + cancel dance of asyncio.wait_for
+        try:
+            with contextlib.suppress(TimeoutError):
+                async with asyncio.timeout(timeout):
+                    await fut
+        finally:
+            # On timeout the event never fired, so the one-shot entry is
+            # still registered; drop it or it would accumulate across
+            # repeated waits for an event that never arrives.
+            waiters = self._once_handlers.get(event)
+            if waiters:
+                waiters.pop((on_loaded, False), None)
 
     async def eval(
         self,
@@ -223,6 +420,40 @@ class Tab:
         )
         return result
 
+    async def eval_many(
+        self,
+        expressions: list[str],
+        await_promise: bool = True,
+    ) -> list[Any]:
+        """Evaluate several JavaScript expressions in one round-trip.
+
+        The expressions are wrapped into a single array-building call,
+        so N sequential `eval` round-trips collapse into one — saving
+        `len(expressions) - 1` full CDP round-trips. Results come back
+        by value, in input order.
+
+        Args:
+            expressions: JavaScript expressions to evaluate.
+            await_promise: Whether to await promise-valued expressions.
+
+        Returns:
+            list[Any]: The value of each expression, in input order.
+        """
+        if not expressions:
+            return []
+        joined = ", ".join(
+            f"await ({expression})" if await_promise else f"({expression})"
+            for expression in expressions
+        )
+        res, _ = await self.send(
+            cdp.runtime.evaluate(
+                expression=f"(async () => [{joined}])()",
+                await_promise=True,
+                return_by_value=True,
+            )
+        )
+        return list(res.value or [])
+
     # DOM selection ----------------------------------------------------------
 
     async def find_elems(
@@ -230,56 +461,92 @@ class Tab:
         query: str,
         depth: int = 100,
         pierce: bool = True,
-    ) -> list[Elem]:
+    ) -> Sequence[Elem]:
         """Find all elements matching the specified query.
 
         Searches from the document root and includes iframes. To search
         within a specific element, use `Elem.query_selector()`.
 
+        The document node is cached on the tab between calls and
+        invalidated on DOM updates and navigations, so repeated searches
+        skip the get_document round-trip. When the page has no iframes,
+        the result is a lazy `ElemBatch` that builds element wrappers on
+        access instead of one per match up front.
+
         Args:
             query: Plain text, CSS selector, or XPath search query.
             depth: Max depth to retrieve the document node.
             pierce: Whether to pierce shadow DOM boundaries.
 
         Returns:
-            list[Elem]: List of matching elements, empty if nothing found.
+            Sequence[Elem]: Matching elements, empty if nothing found.
         """
-        elems = []
-        self.doc = await self.send(
-            cdp.dom.get_document(
-                depth,
-                pierce,
-            )
-        )
-        search_id, count = await self.send(
+        elems: list[Elem] = []
+        search = self.send(
             cdp.dom.perform_search(
                 query=query,
                 include_user_agent_shadow_dom=True,
             )
         )
+        doc = self._doc_cache.get((depth, pierce))
+        if doc is None:
+            # The search does not depend on the document fetch, so
+            # pipeline both round-trips over the same connection.
+            fetched: cdp.dom.Node
+            fetched, (search_id, count) = await asyncio.gather(
+                self.send(
+                    cdp.dom.get_document(
+                        depth,
+                        pierce,
+                    )
+                ),
+                search,
+            )
+            doc = fetched
+            self._doc_cache[(depth, pierce)] = doc
+        else:
+            search_id, count = await search
+        if doc is not self.doc:
+            self._node_index = None
+        self.doc = doc
+        found_nodes: list[cdp.dom.NodeId] = []
         if count:
-            found_nodes: list[cdp.dom.NodeId] = await self.send(
+            found_nodes = await self.send(
                 cdp.dom.get_search_results(
                     search_id=search_id,
                     from_index=0,
                     to_index=count,
                 )
             )
-            await self.send(
-                cdp.dom.discard_search_results(
-                    search_id,
-                ),
+            # Nothing depends on the discard; fire and forget.
+            discard = asyncio.create_task(
+                self.send(
+                    cdp.dom.discard_search_results(
+                        search_id,
+                    ),
+                )
             )
-            for node_id in found_nodes:
-                elems.append(self.elem(node_id))
-        # Search in iframes
-        frames = self._frame_nodes(self.doc)
-        for frame in frames:
-            frame_elems = await frame.find_elems(
-                query=query,
-                depth=depth,
-                pierce=pierce,
+            discard.add_done_callback(_log_task_error)
+        frames = self._frame_nodes(doc)
+        if not frames:
+            # Frameless fast path: hand back a lazy view over the node
+            # ids rather than materializing N wrappers.
+            return ElemBatch(self, found_nodes) if found_nodes else elems
+        for node_id in found_nodes:
+            elems.append(self.elem(node_id))
+        # Search in iframes concurrently: total wall time is bounded by
+        # the slowest frame instead of the sum over frames.
+        frame_results = await asyncio.gather(
+            *(
+                frame.find_elems(
+                    query=query,
+                    depth=depth,
+                    pierce=pierce,
+                )
+                for frame in frames
             )
+        )
+        for frame_elems in frame_results:
             elems.extend(frame_elems)
         return elems
 
@@ -288,9 +555,13 @@ class Tab:
         query: str,
         timeout: float = 10.0,
         **kwargs: Any,
-    ) -> list[Elem]:
+    ) -> Sequence[Elem]:
         """Wait for elements matching the specified query to appear.
 
+        The search is re-run when a DOM change event arrives instead of
+        on a fixed polling interval; the poll interval only acts as a
+        safety-net re-check between events.
+
         Args:
             query: Plain text, CSS selector, or XPath search query.
             timeout: Maximum seconds to wait.
@@ -298,18 +569,46 @@ class Tab:
                 (e.g., depth, pierce, poll).
 
         Returns:
-            list[Elem]: List of matching elements, empty if timeout.
+            Sequence[Elem]: Matching elements, empty if timeout.
         """
         poll: float = kwargs.get("poll", 0.5)
         depth: int = kwargs.get("depth", 100)
         pierce: bool = kwargs.get("pierce", True)
-        end: float = asyncio.get_running_loop().time() + timeout
-        while asyncio.get_running_loop().time() < end:
-            elems: list[Elem] = await self.find_elems(query, depth, pierce)
-            if elems:
-                return elems
-            await asyncio.sleep(poll)
-        return []
+        elems: Sequence[Elem] = await self.find_elems(query, depth, pierce)
+        if elems or timeout <= 0:
+            return elems
+        loop = asyncio.get_running_loop()
+        end: float = loop.time() + timeout
+        changed = asyncio.Event()
+
+        def on_dom_change(_: Any) -> None:
+            changed.set()
+
+        # Safety-net interval backs off exponentially toward the user's
+        # poll cap; event arrivals re-check immediately regardless.
+        interval: float = min(poll, 0.02)
+        for event in _DOM_CHANGE_EVENTS:
+            self.on(event, on_dom_change)
+        try:
+            while True:
+                remaining: float = end - loop.time()
+                if remaining <= 0:
+                    return []
+                with contextlib.suppress(TimeoutError):
+                    async with asyncio.timeout(min(interval, remaining)):
+                        await changed.wait()
+                interval = min(interval * 1.5, poll)
+                changed.clear()
+                elems = await self.find_elems(query, depth, pierce)
+                if elems:
+                    return elems
+        finally:
+            for event in _DOM_CHANGE_EVENTS:
+                handlers = self._handlers.get(event, [])
+                for i, (h, _) in enumerate(handlers):
+                    if h is on_dom_change:
+                        del handlers[i]
+                        break
 
     async def find_elem(
         self,
@@ -335,6 +634,210 @@ class Tab:
             return elems[0]
         return None
 
+    async def query_selector_all(
+        self,
+        selector: str,
+    ) -> list[Elem]:
+        """Find all elements matching a CSS selector in the top frame.
+
+        Fast path for pure CSS selectors: a single `Runtime.evaluate` of
+        `document.querySelectorAll` replaces the document serialization
+        and search round-trips of `find_elems`, and the matched nodes
+        are described concurrently. Does not search iframes or pierce
+        shadow DOM — use `find_elems` for text/XPath queries or frame
+        traversal.
+
+        Args:
+            selector: The CSS selector string.
+
+        Returns:
+            list[Elem]: List of matching elements, empty if nothing
+                found.
+        """
+        collection = await self._qsa_call(selector, _QSA_ALL_CALL_JS)
+        if collection is None or collection.object_id is None:
+            return []
+        props, _, _, _ = await self.send(
+            cdp.runtime.get_properties(
+                collection.object_id,
+                own_properties=True,
+            )
+        )
+        # The NodeList's enumerable own properties are its indexed
+        # entries; length and friends are non-enumerable.
+        object_ids = [
+            prop.value.object_id
+            for prop in props
+            if prop.enumerable
+            and prop.value is not None
+            and prop.value.object_id is not None
+        ]
+        if not object_ids:
+            return []
+        nodes = await asyncio.gather(
+            *(
+                self.send(cdp.dom.describe_node(object_id=oid))
+                for oid in object_ids
+            )
+        )
+        return [self._make_elem(node) for node in nodes]
+
+    async def query_selector(
+        self,
+        selector: str,
+    ) -> Elem | None:
+        """Find the first element matching a CSS selector in the top frame.
+
+        Single-round-trip counterpart of `find_elem` for pure CSS
+        selectors; see `query_selector_all` for the trade-offs.
+
+        Args:
+            selector: The CSS selector string.
+
+        Returns:
+            Elem | None: The first matching element, or None if not
+                found.
+        """
+        obj = await self._qsa_call(selector, _QSA_FIRST_CALL_JS)
+        if obj is None or obj.object_id is None:
+            return None
+        node = await self.send(cdp.dom.describe_node(object_id=obj.object_id))
+        return self._make_elem(node)
+
+    async def count(
+        self,
+        selector: str,
+    ) -> int:
+        """Count elements matching a CSS selector in the top frame.
+
+        Evaluates `querySelectorAll(...).length` in the page, so the
+        round-trip carries a single integer instead of marshaling node
+        ids and building an Elem per match. Use this (or `exists`) for
+        existence checks instead of `len(await find_elems(...))`.
+
+        Args:
+            selector: The CSS selector string.
+
+        Returns:
+            int: Number of matching elements.
+        """
+        res, _ = await self.send(
+            cdp.runtime.evaluate(
+                expression="document.querySelectorAll(%s).length"
+                % json.dumps(selector),
+                return_by_value=True,
+            )
+        )
+        return int(res.value or 0)
+
+    async def exists(
+        self,
+        selector: str,
+    ) -> bool:
+        """Check whether a CSS selector matches in the top frame.
+
+        Single boolean round-trip; see `count` for the trade-offs.
+
+        Args:
+            selector: The CSS selector string.
+
+        Returns:
+            bool: True if at least one element matches.
+        """
+        res, _ = await self.send(
+            cdp.runtime.evaluate(
+                expression="!!document.querySelector(%s)"
+                % json.dumps(selector),
+                return_by_value=True,
+            )
+        )
+        return bool(res.value)
+
+    async def wait_for_selector(
+        self,
+        selector: str,
+        timeout: float = 10.0,
+    ) -> Elem | None:
+        """Wait for a CSS selector to match anywhere in the top frame.
+
+        Installs a document-level MutationObserver in the page that
+        resolves as soon as the selector matches, so the whole wait is
+        a single CDP round-trip instead of O(timeout / poll) re-query
+        round-trips. Like `query_selector`, this accepts CSS selectors
+        only and does not search iframes; use `wait_for_elems` for
+        text/XPath queries or frame traversal.
+
+        Args:
+            selector: The CSS selector string.
+            timeout: Maximum seconds to wait.
+
+        Returns:
+            Elem | None: The matching element, or None if timeout.
+        """
+        if timeout <= 0:
+            return await self.query_selector(selector)
+        res, _ = await self.send(
+            cdp.runtime.evaluate(
+                expression=_WAIT_DOC_SELECTOR_JS
+                % (json.dumps(selector), int(timeout * 1000)),
+                await_promise=True,
+                return_by_value=True,
+            )
+        )
+        if res is not None and res.value:
+            return await self.query_selector(selector)
+        return None
+
+    async def _qsa_call(
+        self,
+        selector: str,
+        call_js: str,
+    ) -> cdp.runtime.RemoteObject | None:
+        """Run a selector query through the cached function handle.
+
+        The querySelectorAll function is evaluated once per tab and
+        invoked via `Runtime.callFunctionOn` afterwards, so repeated
+        queries skip re-compiling the selector expression. The handle
+        is dropped on navigation events and refreshed once if it has
+        gone stale (e.g. execution context destroyed).
+
+        Args:
+            selector: The CSS selector string.
+            call_js: Trampoline function source invoked with the cached
+                function as ``this``.
+
+        Returns:
+            RemoteObject | None: The query result object, or None if
+                the function handle cannot be (re)established.
+        """
+        for _ in range(2):
+            fn = self._qsa_fn
+            if fn is None or fn.object_id is None:
+                fn, _ = await self.send(
+                    cdp.runtime.evaluate(
+                        expression=_QSA_FN_JS,
+                        return_by_value=False,
+                    )
+                )
+                self._qsa_fn = fn
+            if fn is None or fn.object_id is None:
+                return None
+            try:
+                obj: cdp.runtime.RemoteObject
+                obj, _ = await self.send(
+                    cdp.runtime.call_function_on(
+                        object_id=fn.object_id,
+                        function_declaration=call_js,
+                        arguments=[cdp.runtime.CallArgument(value=selector)],
+                        return_by_value=False,
+                    )
+                )
+                return obj
+            except RuntimeError as e:
+                logger.debug("Selector fn handle stale, refreshing: %s", e)
+                self._qsa_fn = None
+        return None
+
     async def wait_for_elem(
         self,
         query: str,
@@ -357,26 +860,122 @@ class Tab:
             return elems[0]
         return None
 
+    async def positions(
+        self,
+        elems: list[Elem],
+    ) -> list[Position | None]:
+        """Get positions for multiple elements concurrently.
+
+        Issues the get_content_quads commands for all elements at once
+        instead of awaiting them one by one, so the total latency is one
+        round-trip rather than one per element.
+
+        Args:
+            elems: Elements to fetch positions for.
+
+        Returns:
+            list[Position | None]: Position per element, in input order;
+                None where a position is unavailable.
+        """
+        return list(await asyncio.gather(*(e.position() for e in elems)))
+
+    async def bounding_rects(
+        self,
+        selector: str,
+    ) -> list[Position]:
+        """Get bounding rects for all elements matching a selector.
+
+        Runs a single querySelectorAll in the page and returns one quad
+        per match, so N elements cost one CDP round-trip instead of one
+        get_content_quads call each. Use per-Elem `position()` when only
+        a single element is needed.
+
+        Args:
+            selector: CSS selector string.
+
+        Returns:
+            list[Position]: Positions of matching elements, in document
+                order; empty if nothing matches.
+        """
+        expr = (
+            "Array.from(document.querySelectorAll(%s)).map(e => {"
+            " const r = e.getBoundingClientRect();"
+            " return [r.left, r.top, r.right, r.top,"
+            " r.right, r.bottom, r.left, r.bottom]; })" % json.dumps(selector)
+        )
+        res, _ = await self.send(
+            cdp.runtime.evaluate(
+                expression=expr,
+                return_by_value=True,
+            )
+        )
+        return [Position(quad=quad) for quad in (res.value or [])]
+
     async def close(
         self,
+        timeout: float = 2.0,
     ) -> None:
         """Close this tab.
 
         Sends a close target command. Errors are suppressed if the tab
-        is already closed or connection is lost.
+        is already closed or connection is lost; the wait is bounded so
+        teardown cannot hang on a dead connection.
+
+        Args:
+            timeout: Maximum seconds to wait for the close round-trip.
         """
         try:
-            await self.browser.send(
-                cdp.target.close_target(
-                    target_id=self.target_id,
+            async with asyncio.timeout(timeout):
+                await self.browser.send(
+                    cdp.target.close_target(
+                        target_id=self.target_id,
+                    )
                 )
-            )
-        except (RuntimeError, ConnectionError):
+        except (TimeoutError, RuntimeError, ConnectionError):
             # Tab may already be closed or connection lost
             logger.debug("Could not close tab %s", self.target_id)
 
     # Attributes--------------------------------------------------------------
 
+    @property
+    def target_info(
+        self,
+    ) -> cdp.target.TargetInfo | None:
+        """Target metadata for this tab, updated on TargetInfoChanged."""
+        return self._target_info
+
+    @target_info.setter
+    def target_info(
+        self,
+        info: cdp.target.TargetInfo | None,
+    ) -> None:
+        self._target_info = info
+        # Frame parentage may have changed; recompute root lazily
+        self._root = None
+
+    @property
+    def root(
+        self,
+    ) -> Tab:
+        """Get the top-level tab of this frame hierarchy.
+
+        For top-level pages this is the tab itself; for iframes it is
+        the outermost ancestor. The result is cached and recomputed
+        lazily when target_info is reassigned.
+
+        Returns:
+            Tab: The top-level Tab instance.
+        """
+        root = self._root
+        if root is None:
+            root = self
+            parent = root.parent
+            while parent is not None:
+                root = parent
+                parent = root.parent
+            self._root = root
+        return root
+
     @property
     def parent(
         self,
@@ -403,14 +1002,44 @@ class Tab:
             )
         return None
 
+    def _make_elem(
+        self,
+        node: cdp.dom.Node,
+    ) -> Elem:
+        """Create or reuse an Elem wrapping a DOM node.
+
+        Elems are memoized per tab in a weak-value cache keyed on
+        backend_node_id (falling back to node_id), so repeated lookups
+        of the same node — e.g. elem.parent.parent chains — return the
+        same instance instead of allocating a new wrapper. The cache is
+        cleared whenever the cached document is invalidated.
+
+        Args:
+            node: The CDP Node to wrap.
+
+        Returns:
+            Elem: The cached or newly constructed Elem instance.
+        """
+        key = node.backend_node_id or node.node_id
+        if key is not None:
+            elem = self._elem_cache.get(int(key))
+            if elem is not None:
+                return elem
+        elem = self.elem_class(tab=self, node=node)
+        if key is not None:
+            self._elem_cache[int(key)] = elem
+        return elem
+
     def elem(
         self,
         node_id: cdp.dom.NodeId,
     ) -> Elem:
         """Create an Elem instance from a CDP NodeId.
 
-        Searches the document tree for the node with the specified ID
-        and wraps it in an Elem instance for interaction.
+        Looks up the node with the specified ID and wraps it in an Elem
+        instance for interaction. The lookup goes through a node_id
+        index built once per cached document, so resolving many nodes
+        (e.g. all search hits from `find_elems`) walks the tree once.
 
         Args:
             node_id: The NodeId of the DOM element to find.
@@ -423,32 +1052,29 @@ class Tab:
                 with the specified ID is not found.
         """
 
-        def _filter(
-            nid: cdp.dom.NodeId,
-            root: cdp.dom.Node,
-        ) -> Elem | None:
-            if root.node_id == nid:
-                return self.elem_class(tab=self, node=root)
-            node_children = root.children or []
-            shadow_roots = root.shadow_roots or []
-            children = node_children + shadow_roots
-            for child in children:
-                if child.node_id == nid:
-                    return self.elem_class(tab=self, node=child)
-                if child.content_document:
-                    elem = _filter(nid, child.content_document)
-                else:
-                    elem = _filter(nid, child)
-                if elem:
-                    return elem
-            return None
-
         if self.doc is None:
             raise ValueError("Tab document not loaded")
-        elem = _filter(node_id, self.doc)
-        if elem:
-            return elem
-        raise ValueError(f"Node with id {node_id} not found in root")
+        index = self._node_index
+        if index is None:
+            # Build the node_id -> node map in one iterative walk; later
+            # lookups against the same document are O(1) dict probes.
+            index = {}
+            stack: list[cdp.dom.Node] = [self.doc]
+            while stack:
+                node = stack.pop()
+                index[node.node_id] = node
+                if node.content_document:
+                    stack.append(node.content_document)
+                    continue
+                if node.children:
+                    stack.extend(node.children)
+                if node.shadow_roots:
+                    stack.extend(node.shadow_roots)
+            self._node_index = index
+        found = index.get(node_id)
+        if found is None:
+            raise ValueError(f"Node with id {node_id} not found in root")
+        return self._make_elem(found)
 
     def _frame_nodes(
         self,
@@ -469,31 +1095,32 @@ class Tab:
         def _get_target(
             frame_id: cdp.page.FrameId,
         ) -> Tab | None:
-            return next(
-                (
-                    self.browser.targets[t]
-                    for t in self.browser.targets
-                    if str(t) == str(frame_id)
-                ),
-                None,
-            )
+            # TargetID and FrameId are both str subclasses, so the
+            # targets dict can be probed directly instead of scanned.
+            return self.browser.targets.get(cdp.target.TargetID(str(frame_id)))
 
         out = []
-        node_children = node.children or []
-        shadow_roots = node.shadow_roots or []
-        children = node_children + shadow_roots
-        for child in children:
-            if child.node_name == "IFRAME":
-                if child.frame_id:
-                    tab = _get_target(child.frame_id)
-                    if tab:
-                        out.append(tab)
-                    else:
-                        logger.debug(
-                            "Could not find target for frame id %s",
-                            child.frame_id,
-                        )
-            out.extend(self._frame_nodes(child))
+        # Iterative preorder walk; reversed pushes keep document order.
+        stack: list[cdp.dom.Node] = []
+        if node.shadow_roots:
+            stack.extend(reversed(node.shadow_roots))
+        if node.children:
+            stack.extend(reversed(node.children))
+        while stack:
+            child = stack.pop()
+            if child.node_name == "IFRAME" and child.frame_id:
+                tab = _get_target(child.frame_id)
+                if tab:
+                    out.append(tab)
+                elif logger.isEnabledFor(logging.DEBUG):
+                    logger.debug(
+                        "Could not find target for frame id %s",
+                        child.frame_id,
+                    )
+            if child.shadow_roots:
+                stack.extend(reversed(child.shadow_roots))
+            if child.children:
+                stack.extend(reversed(child.children))
         return out
 
     def __repr__(
@@ -529,9 +1156,17 @@ class Tab:
         """
         if name == "type":
             name = "type_"
-        if self.target_info and hasattr(self.target_info, name):
-            return getattr(self.target_info, name)
-        raise AttributeError(f"'Tab' object has no attribute '{name}'")
+        # Single getattr instead of hasattr-then-getattr: hasattr is a
+        # try/except getattr itself, so probing first doubles the lookup
+        info = self.target_info
+        if info is not None:
+            try:
+                return getattr(info, name)
+            except AttributeError:
+                pass
+        raise AttributeError(
+            f"'Tab' object has no attribute '{name}'"
+        ) from None
 
 
 __all__ = ["Tab"]
@@ -2,7 +2,6 @@
 
 from __future__ import annotations
 
-import asyncio
 import functools
 from http import cookiejar
 from typing import TYPE_CHECKING, Any, Callable, TypeVar, cast
@@ -14,6 +13,9 @@ if TYPE_CHECKING:
 
 F = TypeVar("F", bound=Callable[..., Any])
 
+# Browser error text that signals a detached session
+_SESSION_GONE = "Session with given id not found"
+
 
 def tab_attached(func: F) -> F:
     """Decorator to ensure the element's tab session is still active.
@@ -41,21 +43,46 @@ def tab_attached(func: F) -> F:
 
     @functools.wraps(func)
     async def wrapper(self: Elem, *args: Any, **kwargs: Any) -> Any:
-        msg = f"Target {self.tab.target_id} is no longer available."
+        # Error messages are built only on the failure branches; the
+        # common success path pays just the None check
         if self.tab.session_id is None:
-            raise ReferenceError(msg)
+            raise ReferenceError(
+                f"Target {self.tab.target_id} is no longer available."
+            )
         try:
-            result = await func(self, *args, **kwargs)
-            await asyncio.sleep(0)
-            return result
+            return await func(self, *args, **kwargs)
         except RuntimeError as e:
-            if "Session with given id not found" in str(e):
-                raise ReferenceError(msg) from e
+            # Probe args[0] directly rather than str(e), which would
+            # re-format the exception on every decorated raise
+            msg = e.args[0] if e.args else ""
+            if isinstance(msg, str) and _SESSION_GONE in msg:
+                raise ReferenceError(
+                    f"Target {self.tab.target_id} is no longer available."
+                ) from e
             raise
 
     return cast(F, wrapper)
 
 
+def install_uvloop() -> bool:
+    """Install uvloop as the asyncio event loop implementation.
+
+    CDP throughput is bounded by the event loop's I/O dispatch; uvloop
+    speeds that up substantially on POSIX systems. uvloop is an optional
+    dependency (the ``speed`` extra); when it is not installed this is
+    a no-op so callers can invoke it unconditionally.
+
+    Returns:
+        bool: True if uvloop was installed, False if unavailable.
+    """
+    try:
+        import uvloop
+    except ImportError:  # pragma: no cover - exercised only without uvloop
+        return False
+    uvloop.install()
+    return True
+
+
 class CookieJar(cookiejar.CookieJar):
     """Custom CookieJar for pypecdp.
 
@@ -76,6 +103,11 @@ class CookieJar(cookiejar.CookieJar):
         cdp_cookies: Optional list of CDP cookies to populate the jar.
     """
 
+    # The stdlib base still carries a __dict__, so this only moves
+    # cdp_cookies into a slot; kept for faster access on the one
+    # attribute this subclass adds.
+    __slots__ = ("cdp_cookies",)
+
     def __init__(
         self,
         cdp_cookies: list[cdp.network.Cookie] | None = None,
@@ -88,42 +120,48 @@ class CookieJar(cookiejar.CookieJar):
         super().__init__()
         # Store original CDP cookies for reference
         self.cdp_cookies = cdp_cookies
-        # Convert and add CDP cookies to the CookieJar
+        # Convert and add CDP cookies to the CookieJar. The cookies come
+        # from the browser itself, so the per-cookie policy walk and lock
+        # round-trip of set_cookie are skipped: insert directly into the
+        # store under a single lock acquisition.
         if cdp_cookies:
-            for cdp_cookie in cdp_cookies:
-                # Determine domain matching behavior
-                domain = cdp_cookie.domain
-                domain_initial_dot = domain.startswith(".")
-                # Handle expiry: CDP uses -1 for session, None for unrepresentable
-                # CookieJar expects None for session, timestamp for persistent
-                expires = None
-                discard = cdp_cookie.session
-                if (
-                    not cdp_cookie.session
-                    and cdp_cookie.expires is not None
-                    and cdp_cookie.expires >= 0
-                ):
-                    expires = int(cdp_cookie.expires)
-                cookie = cookiejar.Cookie(
-                    version=0,  # Netscape cookies (standard)
-                    name=cdp_cookie.name,
-                    value=cdp_cookie.value,
-                    port=None,
-                    port_specified=False,
-                    domain=domain,
-                    domain_specified=True,
-                    domain_initial_dot=domain_initial_dot,
-                    path=cdp_cookie.path,
-                    path_specified=True,
-                    secure=cdp_cookie.secure,
-                    expires=expires,
-                    discard=discard,
-                    comment=None,
-                    comment_url=None,
-                    rest={"HttpOnly": str(cdp_cookie.http_only)},
-                    rfc2109=False,
-                )
-                self.set_cookie(cookie)
-
-
-__all__ = ["tab_attached", "CookieJar"]
+            with self._cookies_lock:
+                for cdp_cookie in cdp_cookies:
+                    # Determine domain matching behavior
+                    domain = cdp_cookie.domain
+                    domain_initial_dot = domain.startswith(".")
+                    # Handle expiry: CDP uses -1 for session, None for
+                    # unrepresentable; CookieJar expects None for
+                    # session, timestamp for persistent
+                    expires = (
+                        int(cdp_cookie.expires)
+                        if not cdp_cookie.session
+                        and cdp_cookie.expires is not None
+                        and cdp_cookie.expires >= 0
+                        else None
+                    )
+                    cookie = cookiejar.Cookie(
+                        version=0,  # Netscape cookies (standard)
+                        name=cdp_cookie.name,
+                        value=cdp_cookie.value,
+                        port=None,
+                        port_specified=False,
+                        domain=domain,
+                        domain_specified=True,
+                        domain_initial_dot=domain_initial_dot,
+                        path=cdp_cookie.path,
+                        path_specified=True,
+                        secure=cdp_cookie.secure,
+                        expires=expires,
+                        discard=cdp_cookie.session,
+                        comment=None,
+                        comment_url=None,
+                        rest={"HttpOnly": str(cdp_cookie.http_only)},
+                        rfc2109=False,
+                    )
+                    self._cookies.setdefault(domain, {}).setdefault(
+                        cookie.path, {}
+                    )[cookie.name] = cookie
+
+
+__all__ = ["tab_attached", "install_uvloop", "CookieJar"]
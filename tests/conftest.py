@@ -7,6 +7,20 @@ from unittest.mock import AsyncMock, MagicMock, Mock
 import pytest
 
 
+def pytest_asyncio_loop_factories(config: Any, item: Any) -> dict[str, Any]:
+    """Run async tests on uvloop when it is installed.
+
+    pytest-asyncio builds every test loop from this factory; uvloop is
+    optional (the `speed` extra), so fall back to the stock loop when
+    the import fails.
+    """
+    try:
+        import uvloop
+    except ImportError:
+        return {"asyncio": asyncio.new_event_loop}
+    return {"uvloop": uvloop.new_event_loop}
+
+
 @pytest.fixture
 def mock_process() -> Mock:
     """Create a mock subprocess."""
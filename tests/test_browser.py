@@ -128,6 +128,42 @@ class TestBrowser:
             with pytest.raises(RuntimeError, match="CDP error"):
                 await browser.send(mock_cmd())
 
+    @pytest.mark.asyncio
+    async def test_send_bounded_by_concurrency_limit(self) -> None:
+        """Test concurrent writes are capped at max_concurrent_sends."""
+        import asyncio
+
+        browser = Browser(config=Config(max_concurrent_sends=1))
+        browser.writer = Mock()
+        browser.writer.write = Mock()
+        drain_gate = asyncio.Event()
+        browser.writer.drain = drain_gate.wait
+
+        def mock_cmd():
+            yield {"method": "Page.enable"}
+            return None
+
+        first = asyncio.create_task(browser.send(mock_cmd()))
+        second = asyncio.create_task(browser.send(mock_cmd()))
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # The first write has not drained yet, so the second waits
+        assert browser.writer.write.call_count == 1
+
+        drain_gate.set()
+        for _ in range(5):
+            await asyncio.sleep(0)
+
+        # Once drained the semaphore is released: the second command
+        # goes on the wire even though the first response is pending
+        assert browser.writer.write.call_count == 2
+
+        browser._pending[1].set_result({"id": 1, "result": {}})
+        browser._pending[2].set_result({"id": 2, "result": {}})
+        await first
+        await second
+
     def test_on_registers_handler(self) -> None:
         """Test on() registers event handler."""
         browser = Browser()
@@ -136,7 +172,7 @@ class TestBrowser:
         browser.on(cdp.target.TargetCreated, handler)
 
         assert cdp.target.TargetCreated in browser._handlers
-        assert handler in browser._handlers[cdp.target.TargetCreated]
+        assert (handler, False) in browser._handlers[cdp.target.TargetCreated]
 
     def test_clear_handlers(self) -> None:
         """Test clear_handlers removes all handlers."""
@@ -162,6 +198,24 @@ class TestBrowser:
         assert tab.target_id == cdp.target.TargetID("new-target")
         assert cdp.target.TargetID("new-target") in browser.targets
 
+    @pytest.mark.asyncio
+    async def test_close_all_closes_tabs_concurrently(self) -> None:
+        """Test close_all awaits close on every known tab."""
+        browser = Browser()
+        tab1 = Mock()
+        tab1.close = AsyncMock()
+        tab2 = Mock()
+        tab2.close = AsyncMock(side_effect=RuntimeError("gone"))
+        browser.targets = {
+            cdp.target.TargetID("t1"): tab1,
+            cdp.target.TargetID("t2"): tab2,
+        }
+
+        await browser.close_all()
+
+        tab1.close.assert_awaited_once()
+        tab2.close.assert_awaited_once()
+
     @pytest.mark.asyncio
     async def test_navigate_creates_new_tab(self) -> None:
         """Test navigate with new_tab=True creates new tab."""
@@ -2,6 +2,7 @@
 
 import os
 import tempfile
+import uuid
 from pathlib import Path
 
 import pytest
@@ -12,6 +13,16 @@ from pypecdp.config import Config
 class TestConfig:
     """Test suite for Config class."""
 
+    @pytest.fixture(scope="session")
+    def profile_root(self, tmp_path_factory: pytest.TempPathFactory) -> Path:
+        """Shared root for per-test profile directories.
+
+        Tests take unique subdirectories and never delete them
+        individually; pytest removes the whole root in one sweep at
+        session teardown instead of one mkdir+rmtree per test.
+        """
+        return tmp_path_factory.mktemp("pypecdp-profiles")
+
     def test_default_config(self) -> None:
         """Test Config with default values."""
         config = Config()
@@ -19,7 +30,7 @@ class TestConfig:
         assert config.chrome_path == "chromium"
         assert config.user_data_dir is None
         assert config.headless is True
-        assert config.extra_args == []
+        assert list(config.extra_args) == []
         assert config.ignore_default_args is None
         assert config.env == {}
 
@@ -52,9 +63,11 @@ class TestConfig:
         assert config.user_data_dir == data_dir
         assert Path(data_dir).exists()
 
-    def test_ensure_user_data_dir_uses_existing(self) -> None:
+    def test_ensure_user_data_dir_uses_existing(
+        self, profile_root: Path
+    ) -> None:
         """Test that ensure_user_data_dir uses existing directory."""
-        test_dir = "/tmp/test-pypecdp-profile"
+        test_dir = str(profile_root / uuid.uuid4().hex)
         config = Config(user_data_dir=test_dir)
 
         data_dir = config.ensure_user_data_dir()
@@ -70,7 +83,7 @@ class TestConfig:
 
         assert "--headless=new" in argv
         assert "--remote-debugging-pipe" in argv
-        assert any("--user-data-dir=" in arg for arg in argv)
+        assert "--user-data-dir" in argv.prefix_set
         assert "about:blank" in argv
 
     def test_build_argv_not_headless(self) -> None:
@@ -98,7 +111,7 @@ class TestConfig:
         argv = config.build_argv()
 
         # Should not contain --disable-gpu
-        assert not any("--disable-gpu" in arg for arg in argv)
+        assert "--disable-gpu" not in argv.prefix_set
 
     def test_build_argv_ignore_default_args_with_prefix(self) -> None:
         """Test ignore_default_args works with -- prefix."""
@@ -106,7 +119,14 @@ class TestConfig:
 
         argv = config.build_argv()
 
-        assert not any("--disable-gpu" in arg for arg in argv)
+        assert "--disable-gpu" not in argv.prefix_set
+
+    def test_filtered_default_args_shared_across_configs(self) -> None:
+        """Test identical ignore lists reuse one filtered tuple."""
+        first = Config(ignore_default_args=["disable-gpu"])
+        second = Config(ignore_default_args=["disable-gpu"])
+
+        assert first._static_args is second._static_args
 
     def test_build_argv_default_args_included(self) -> None:
         """Test build_argv includes expected default arguments."""
@@ -117,7 +137,16 @@ class TestConfig:
         assert "--accept-lang=en-US" in argv
         assert "--no-first-run" in argv
         assert "--no-default-browser-check" in argv
-        assert any("--disable-blink-features" in arg for arg in argv)
+        assert "--disable-blink-features" in argv.prefix_set
+
+    def test_build_argv_prefix_set_memoized(self) -> None:
+        """Test prefix_set is computed once per argv."""
+        config = Config()
+
+        argv = config.build_argv()
+
+        assert argv.prefix_set is argv.prefix_set
+        assert "--remote-debugging-pipe" in argv.prefix_set
 
     def test_build_env(self) -> None:
         """Test build_env merges environment variables."""
@@ -142,6 +171,24 @@ class TestConfig:
         assert len(env) > 0
         assert env == dict(os.environ)
 
+    def test_build_env_snapshot_scoped_per_instance(self) -> None:
+        """Test one Config's snapshot does not leak into another."""
+        Config().build_env()  # Prime an unrelated instance's snapshot
+
+        assert Config().build_env() == dict(os.environ)
+
+    def test_refresh_env_picks_up_mutations(
+        self, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test refresh_env drops the cached environment snapshot."""
+        config = Config()
+        config.build_env()  # Prime the snapshot
+
+        monkeypatch.setenv("PYPECDP_TEST_VAR", "value")
+        config.refresh_env()
+
+        assert config.build_env()["PYPECDP_TEST_VAR"] == "value"
+
     def test_clean_data_dir_default_true(self) -> None:
         """Test that clean_data_dir defaults to True."""
         config = Config()
@@ -155,10 +202,10 @@ class TestConfig:
         assert config.clean_data_dir is False
 
     def test_ensure_user_data_dir_cleans_existing(
-        self, tmp_path: Path
+        self, profile_root: Path
     ) -> None:
         """Test that ensure_user_data_dir removes existing directory when clean_data_dir=True."""
-        test_dir = tmp_path / "test-profile"
+        test_dir = profile_root / uuid.uuid4().hex
         test_dir.mkdir()
         test_file = test_dir / "test.txt"
         test_file.write_text("old data")
@@ -171,10 +218,10 @@ class TestConfig:
         assert not test_file.exists()  # Old file should be removed
 
     def test_ensure_user_data_dir_preserves_existing(
-        self, tmp_path: Path
+        self, profile_root: Path
     ) -> None:
         """Test that ensure_user_data_dir preserves existing directory when clean_data_dir=False."""
-        test_dir = tmp_path / "test-profile"
+        test_dir = profile_root / uuid.uuid4().hex
         test_dir.mkdir()
         test_file = test_dir / "test.txt"
         test_file.write_text("old data")
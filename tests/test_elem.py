@@ -1,5 +1,7 @@
 """Tests for Elem class."""
 
+import time
+from types import SimpleNamespace
 from unittest.mock import AsyncMock, Mock, patch
 
 import pytest
@@ -8,6 +10,16 @@ from pypecdp.cdp import dom
 from pypecdp.elem import Elem, Position
 
 
+def make_node(**attrs: object) -> SimpleNamespace:
+    """Build a plain attribute-only stand-in for a CDP Node.
+
+    SimpleNamespace is enough where a test never records calls on the
+    node: it is cheaper than Mock and raises AttributeError for unset
+    attributes without spec bookkeeping.
+    """
+    return SimpleNamespace(**attrs)
+
+
 class TestPosition:
     """Test suite for Position class."""
 
@@ -61,8 +73,24 @@ class TestElem:
         tab.target_id = "target-123"
         tab.session_id = "session-456"
         tab.send = AsyncMock()
+        tab.send_raw = AsyncMock()
+        tab._make_elem = lambda node: Elem(tab=tab, node=node)
         return tab
 
+    @pytest.fixture
+    def send_seq(self, mock_tab: Mock):
+        """Queue a sequence of tab.send return values.
+
+        Collapses the repeated ``mock_tab.send.side_effect = [...]``
+        setup: call with the values the test expects, in order.
+        """
+
+        def _set(*values: object) -> AsyncMock:
+            mock_tab.send.side_effect = list(values)
+            return mock_tab.send
+
+        return _set
+
     @pytest.fixture
     def mock_node(self) -> Mock:
         """Create a mock DOM Node."""
@@ -94,12 +122,7 @@ class TestElem:
 
     def test_elem_getattr_raises_on_missing(self, mock_tab: Mock) -> None:
         """Test __getattr__ raises AttributeError for missing attributes."""
-        # Create a node with spec to limit attributes
-        node = Mock(
-            spec=["node_id", "backend_node_id", "node_type", "node_name"]
-        )
-        node.node_id = 1
-        node.backend_node_id = 2
+        node = make_node(node_id=1, backend_node_id=2)
         elem = Elem(tab=mock_tab, node=node)
 
         with pytest.raises(
@@ -205,20 +228,44 @@ class TestElem:
 
     @pytest.mark.asyncio
     async def test_click_dispatches_mouse_events(
-        self, elem: Elem, mock_tab: Mock
+        self, elem: Elem, mock_tab: Mock, send_seq
     ) -> None:
         """Test click dispatches press and release events."""
-        quad = [10.0, 20.0, 110.0, 20.0, 110.0, 70.0, 10.0, 70.0]
-        mock_tab.send.return_value = [quad]
+        remote_obj = Mock()
+        remote_obj.object_id = "obj-123"
+        prep_result = Mock()
+        prep_result.value = [60.0, 45.0]
+        # resolve_node, then click prep call_function_on
+        send_seq(remote_obj, (prep_result, None))
         mock_tab.parent = None  # Top-level tab
+        mock_tab.root = mock_tab
 
         result = await elem.click()
 
-        # Should call send at least 3 times: get_content_quads, mousePressed, mouseReleased
-        assert mock_tab.send.call_count >= 3
+        # Should dispatch mousePressed and mouseReleased via send_raw
+        assert mock_tab.send_raw.call_count == 2
         # Should return the top-level tab
         assert result == mock_tab
 
+    @pytest.mark.asyncio
+    async def test_click_invalidates_focus_tracking(
+        self, elem: Elem, mock_tab: Mock, send_seq
+    ) -> None:
+        """Test click drops the typed-focus marker it may have moved."""
+        mock_tab._last_focused_backend = 2  # This element was last typed
+        remote_obj = Mock()
+        remote_obj.object_id = "obj-123"
+        prep_result = Mock()
+        prep_result.value = [60.0, 45.0]
+        send_seq(remote_obj, (prep_result, None))
+        mock_tab.root = mock_tab
+
+        await elem.click()
+
+        # A later type() must re-issue DOM.focus instead of trusting
+        # the pre-click marker
+        assert mock_tab._last_focused_backend is None
+
     @pytest.mark.asyncio
     async def test_type_inserts_text(self, elem: Elem, mock_tab: Mock) -> None:
         """Test type inserts text."""
@@ -231,8 +278,32 @@ class TestElem:
         assert mock_tab.send.call_count >= 3
 
     @pytest.mark.asyncio
-    async def test_text_returns_text_content(
+    async def test_type_skips_focus_when_already_focused(
         self, elem: Elem, mock_tab: Mock
+    ) -> None:
+        """Test type skips the focus round-trip on repeat calls."""
+        mock_tab._last_focused_backend = None
+        mock_tab.send.return_value = None
+
+        await elem.type("hello")  # scroll + focus + insert_text
+        # Pin the scroll freshness rather than racing the real
+        # _SCROLL_TTL window on a slow worker
+        elem._scrolled_at = time.monotonic() + 1000.0
+        await elem.type(" world")  # insert_text only
+
+        assert mock_tab.send.call_count == 4
+        assert mock_tab._last_focused_backend == 2
+
+        # After invalidation the next type pays the scroll + focus again
+        elem.invalidate_position()
+        mock_tab._last_focused_backend = None
+        await elem.type("!")
+
+        assert mock_tab.send.call_count == 7
+
+    @pytest.mark.asyncio
+    async def test_text_returns_text_content(
+        self, elem: Elem, mock_tab: Mock, send_seq
     ) -> None:
         """Test text returns element text content."""
         remote_obj = Mock()
@@ -241,7 +312,7 @@ class TestElem:
         result_obj = Mock()
         result_obj.value = "Hello World"
 
-        mock_tab.send.side_effect = [remote_obj, (result_obj, None)]
+        send_seq(remote_obj, (result_obj, None))
 
         text = await elem.text()
 
@@ -281,8 +352,33 @@ class TestElem:
         assert value is None
 
     @pytest.mark.asyncio
-    async def test_query_selector_returns_elem(
+    async def test_attribute_caches_fetch(
         self, elem: Elem, mock_tab: Mock
+    ) -> None:
+        """Test repeated attribute reads reuse the cached dict."""
+        mock_tab.send.return_value = ["class", "button", "id", "submit-btn"]
+
+        assert await elem.attribute("class") == "button"
+        assert await elem.attribute("id") == "submit-btn"
+
+        mock_tab.send.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_attrs_forces_refetch(
+        self, elem: Elem, mock_tab: Mock
+    ) -> None:
+        """Test invalidate_attrs drops the cached attribute dict."""
+        mock_tab.send.return_value = ["class", "button"]
+
+        await elem.attribute("class")
+        elem.invalidate_attrs()
+        await elem.attribute("class")
+
+        assert mock_tab.send.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_query_selector_returns_elem(
+        self, elem: Elem, mock_tab: Mock, send_seq
     ) -> None:
         """Test query_selector returns Elem."""
         node_id = 5
@@ -290,7 +386,7 @@ class TestElem:
         child_node.node_id = node_id
         child_node.backend_node_id = 6
 
-        mock_tab.send.side_effect = [node_id, child_node]
+        send_seq(node_id, child_node)
 
         result = await elem.query_selector("button")
 
@@ -373,6 +469,35 @@ class TestElem:
         assert result is not None
         assert isinstance(result, Elem)
 
+    @pytest.mark.asyncio
+    async def test_wait_for_selector_uses_mutation_observer(
+        self, elem: Elem, mock_tab: Mock
+    ) -> None:
+        """Test wait_for_selector uses the observer path when resolvable."""
+        remote_obj = Mock()
+        remote_obj.object_id = "obj-123"
+        observer_result = Mock()
+        observer_result.value = True
+
+        child_node = Mock()
+        child_node.node_id = 5
+        child_node.backend_node_id = 6
+
+        node_id = 5
+        mock_tab.send = AsyncMock(
+            side_effect=[
+                remote_obj,  # resolve_node
+                (observer_result, None),  # MutationObserver wait
+                node_id,  # query_selector
+                child_node,  # describe_node
+            ]
+        )
+
+        result = await elem.wait_for_selector("button", timeout=1.0)
+
+        assert result is not None
+        assert isinstance(result, Elem)
+
     @pytest.mark.asyncio
     async def test_wait_for_selector_returns_none_on_timeout(
         self, elem: Elem, mock_tab: Mock
@@ -395,6 +520,37 @@ class TestElem:
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_resolve_object_caches_remote_object(
+        self, elem: Elem, mock_tab: Mock
+    ) -> None:
+        """Test _resolve_object reuses the cached RemoteObject."""
+        remote_obj = Mock()
+        remote_obj.object_id = "obj-123"
+        mock_tab.send = AsyncMock(return_value=remote_obj)
+
+        first = await elem._resolve_object()
+        second = await elem._resolve_object()
+
+        assert first is remote_obj
+        assert second is remote_obj
+        mock_tab.send.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_invalidate_drops_resolved_object(
+        self, elem: Elem, mock_tab: Mock
+    ) -> None:
+        """Test invalidate forces a re-resolve on next use."""
+        remote_obj = Mock()
+        remote_obj.object_id = "obj-123"
+        mock_tab.send = AsyncMock(return_value=remote_obj)
+
+        await elem._resolve_object()
+        elem.invalidate()
+        await elem._resolve_object()
+
+        assert mock_tab.send.call_count == 2
+
     @pytest.mark.asyncio
     async def test_focus_no_backend_node_id(self, mock_tab: Mock) -> None:
         """Test focus returns None when no backend_node_id."""
@@ -425,8 +581,12 @@ class TestElem:
     ) -> None:
         """Test click returns None when position cannot be obtained."""
         mock_tab.send = AsyncMock(
-            side_effect=[None, []]
-        )  # scroll, then empty quads
+            side_effect=[
+                RuntimeError("Cannot resolve"),  # resolve_node
+                None,  # scroll_into_view
+                [],  # empty quads
+            ]
+        )
 
         result = await elem.click()
 
@@ -434,16 +594,21 @@ class TestElem:
 
     @pytest.mark.asyncio
     async def test_click_returns_top_level_tab_from_iframe(
-        self, elem: Elem, mock_tab: Mock
+        self, elem: Elem, mock_tab: Mock, send_seq
     ) -> None:
         """Test click returns top-level tab when element is in an iframe."""
-        quad = [10.0, 20.0, 110.0, 20.0, 110.0, 70.0, 10.0, 70.0]
-        mock_tab.send.return_value = [quad]
+        remote_obj = Mock()
+        remote_obj.object_id = "obj-123"
+        prep_result = Mock()
+        prep_result.value = [60.0, 45.0]
+        # resolve_node, then click prep call_function_on
+        send_seq(remote_obj, (prep_result, None))
 
         # Create parent tab hierarchy
         parent_tab = Mock()
         parent_tab.parent = None  # Top-level
         mock_tab.parent = parent_tab
+        mock_tab.root = parent_tab
 
         result = await elem.click()
 
@@ -454,37 +619,20 @@ class TestElem:
         self, mock_tab: Mock
     ) -> None:
         """Test parent returns parent Elem when parent_id exists."""
-        # Create parent node
-        parent_node = Mock(
-            spec=[
-                "node_id",
-                "backend_node_id",
-                "node_type",
-                "node_name",
-                "parent_id",
-            ]
+        parent_node = make_node(
+            node_id=10,
+            backend_node_id=20,
+            node_type=1,
+            node_name="BODY",
+            parent_id=None,
         )
-        parent_node.node_id = 10
-        parent_node.backend_node_id = 20
-        parent_node.node_type = 1
-        parent_node.node_name = "BODY"
-        parent_node.parent_id = None
-
-        # Create child node with parent_id
-        child_node = Mock(
-            spec=[
-                "node_id",
-                "backend_node_id",
-                "node_type",
-                "node_name",
-                "parent_id",
-            ]
+        child_node = make_node(
+            node_id=1,
+            backend_node_id=2,
+            node_type=1,
+            node_name="DIV",
+            parent_id=10,
         )
-        child_node.node_id = 1
-        child_node.backend_node_id = 2
-        child_node.node_type = 1
-        child_node.node_name = "DIV"
-        child_node.parent_id = 10
 
         # Mock tab.elem to return parent Elem
         parent_elem = Elem(tab=mock_tab, node=parent_node)
@@ -503,10 +651,7 @@ class TestElem:
         self, mock_tab: Mock
     ) -> None:
         """Test parent returns None when parent_id is None."""
-        node = Mock(spec=["node_id", "backend_node_id", "parent_id"])
-        node.node_id = 1
-        node.backend_node_id = 2
-        node.parent_id = None
+        node = make_node(node_id=1, backend_node_id=2, parent_id=None)
 
         elem = Elem(tab=mock_tab, node=node)
 
@@ -518,10 +663,7 @@ class TestElem:
         self, mock_tab: Mock
     ) -> None:
         """Test parent returns None when parent_id is 0 (falsy)."""
-        node = Mock(spec=["node_id", "backend_node_id", "parent_id"])
-        node.node_id = 1
-        node.backend_node_id = 2
-        node.parent_id = 0
+        node = make_node(node_id=1, backend_node_id=2, parent_id=0)
 
         elem = Elem(tab=mock_tab, node=node)
 
@@ -533,15 +675,8 @@ class TestElem:
         self, mock_tab: Mock
     ) -> None:
         """Test parent property can be accessed multiple times."""
-        parent_node = Mock(spec=["node_id", "backend_node_id", "parent_id"])
-        parent_node.node_id = 10
-        parent_node.backend_node_id = 20
-        parent_node.parent_id = None
-
-        child_node = Mock(spec=["node_id", "backend_node_id", "parent_id"])
-        child_node.node_id = 1
-        child_node.backend_node_id = 2
-        child_node.parent_id = 10
+        parent_node = make_node(node_id=10, backend_node_id=20, parent_id=None)
+        child_node = make_node(node_id=1, backend_node_id=2, parent_id=10)
 
         parent_elem = Elem(tab=mock_tab, node=parent_node)
         mock_tab.elem = Mock(return_value=parent_elem)
@@ -553,36 +688,36 @@ class TestElem:
         result2 = elem.parent
 
         assert result1 is not None
-        assert result2 is not None
-        # Each access should call tab.elem
+        assert result2 is result1
+        # The lookup is memoized; repeat accesses skip tab.elem
+        assert mock_tab.elem.call_count == 1
+
+        # invalidate drops the memo and the next access re-resolves
+        elem.invalidate()
+        assert elem.parent is parent_elem
         assert mock_tab.elem.call_count == 2
 
     def test_parent_chain_traversal(self, mock_tab: Mock) -> None:
         """Test parent can be used to traverse up the DOM tree."""
         # Create a chain: grandparent -> parent -> child
-        grandparent_node = Mock(
-            spec=["node_id", "backend_node_id", "node_name", "parent_id"]
+        grandparent_node = make_node(
+            node_id=30,
+            backend_node_id=300,
+            node_name="HTML",
+            parent_id=None,
         )
-        grandparent_node.node_id = 30
-        grandparent_node.backend_node_id = 300
-        grandparent_node.node_name = "HTML"
-        grandparent_node.parent_id = None
-
-        parent_node = Mock(
-            spec=["node_id", "backend_node_id", "node_name", "parent_id"]
+        parent_node = make_node(
+            node_id=20,
+            backend_node_id=200,
+            node_name="BODY",
+            parent_id=30,
         )
-        parent_node.node_id = 20
-        parent_node.backend_node_id = 200
-        parent_node.node_name = "BODY"
-        parent_node.parent_id = 30
-
-        child_node = Mock(
-            spec=["node_id", "backend_node_id", "node_name", "parent_id"]
+        child_node = make_node(
+            node_id=10,
+            backend_node_id=100,
+            node_name="DIV",
+            parent_id=20,
         )
-        child_node.node_id = 10
-        child_node.backend_node_id = 100
-        child_node.node_name = "DIV"
-        child_node.parent_id = 20
 
         # Create Elem instances
         grandparent_elem = Elem(tab=mock_tab, node=grandparent_node)
@@ -1,14 +1,67 @@
 """Tests for Tab class."""
 
 import asyncio
-from unittest.mock import AsyncMock, Mock, patch
+from types import SimpleNamespace
+from unittest.mock import AsyncMock, Mock
 
 import pytest
 
 from pypecdp import cdp
-from pypecdp.elem import Elem
+from pypecdp.elem import Elem, ElemBatch
 from pypecdp.tab import Tab
 
+# IDs reused across the suite, wrapped once instead of per test
+_TARGET_ID = cdp.target.TargetID("target-123")
+_SESSION_ID = cdp.target.SessionID("session-456")
+_FRAME_ID = cdp.page.FrameId("frame-123")
+
+# Canned find_elems round-trip: get_document, perform_search,
+# get_search_results, discard_search_results. Copied into side_effect
+# per test because the mock consumes the list.
+_FIND_ELEMS_SIDE_EFFECT = (
+    SimpleNamespace(children=[], shadow_roots=[]),
+    ("search-123", 2),
+    [cdp.dom.NodeId(1), cdp.dom.NodeId(2)],
+    None,
+)
+
+
+class _ElemStub:
+    """Stand-in for Elem in tests that only pass elements around.
+
+    ``Mock(spec=Elem)`` introspects the whole Elem class with dir() per
+    instance; a plain slotted object is enough where a test just checks
+    identity or awaits a pre-set coroutine attribute.
+    """
+
+    __slots__ = ("node_id", "backend_node_id", "position")
+
+    def __init__(self, **attrs: object) -> None:
+        for name, value in attrs.items():
+            setattr(self, name, value)
+
+
+def make_node(
+    node_name: str | None = None,
+    children: list | tuple = (),
+    shadow_roots: list | tuple = (),
+    content_document: SimpleNamespace | None = None,
+    **attrs: object,
+) -> SimpleNamespace:
+    """Build a plain DOM-node stand-in for tree-walking tests.
+
+    The tree walks in `Tab.elem` and `Tab._frame_nodes` only read
+    attributes, so SimpleNamespace is enough and far cheaper per node
+    than hand-assembling a Mock attribute by attribute.
+    """
+    return SimpleNamespace(
+        node_name=node_name,
+        children=list(children),
+        shadow_roots=list(shadow_roots),
+        content_document=content_document,
+        **attrs,
+    )
+
 
 class TestTab:
     """Test suite for Tab class."""
@@ -21,18 +74,31 @@ class TestTab:
         browser.targets = {}
         return browser
 
-    @pytest.fixture
-    def tab(self, mock_browser: Mock) -> Tab:
-        """Create a Tab instance."""
-        target_id = cdp.target.TargetID("target-123")
+    @pytest.fixture(scope="module")
+    def target_info(self) -> Mock:
+        """Create a shared target info template.
+
+        Built once per module so every Tab can point at the same Mock
+        instead of rebuilding it per test. The root/parent tests write
+        `parent_frame_id` on it, so the `tab` fixture resets that
+        attribute per test to keep the shared instance from leaking
+        state.
+        """
         target_info = Mock()
         target_info.type_ = "page"
         target_info.url = "https://example.com"
         target_info.title = "Example"
-        target_info.target_id = target_id
+        target_info.target_id = _TARGET_ID
+        return target_info
 
-        tab = Tab(mock_browser, target_id, target_info)
-        tab.session_id = cdp.target.SessionID("session-456")
+    @pytest.fixture
+    def tab(self, mock_browser: Mock, target_info: Mock) -> Tab:
+        """Create a Tab instance."""
+        # Undo any parent_frame_id left behind by a previous test (and
+        # the truthy auto-Mock a plain read would otherwise return)
+        target_info.parent_frame_id = None
+        tab = Tab(mock_browser, target_info.target_id, target_info)
+        tab.session_id = _SESSION_ID
         return tab
 
     def test_tab_creation(self, tab: Tab, mock_browser: Mock) -> None:
@@ -66,7 +132,7 @@ class TestTab:
         self, mock_browser: Mock
     ) -> None:
         """Test send raises RuntimeError when session_id is None."""
-        target_id = cdp.target.TargetID("target-123")
+        target_id = _TARGET_ID
         tab = Tab(mock_browser, target_id, None)
         tab.session_id = None
 
@@ -83,7 +149,20 @@ class TestTab:
         tab.on(cdp.page.LoadEventFired, handler)
 
         assert cdp.page.LoadEventFired in tab._handlers
-        assert handler in tab._handlers[cdp.page.LoadEventFired]
+        assert (handler, False) in tab._handlers[cdp.page.LoadEventFired]
+
+    @pytest.mark.asyncio
+    async def test_once_handler_fires_only_once(self, tab: Tab) -> None:
+        """Test once handlers are removed after the first dispatch."""
+        handler = Mock()
+        event_class = type("MockEvent", (), {})
+        tab.once(event_class, handler)
+
+        await tab.handle_event(event_class())
+        await tab.handle_event(event_class())
+
+        handler.assert_called_once()
+        assert event_class not in tab._once_handlers
 
     @pytest.mark.asyncio
     async def test_handle_event_calls_sync_handler(self, tab: Tab) -> None:
@@ -109,6 +188,51 @@ class TestTab:
 
         handler.assert_awaited_once_with(event)
 
+    @pytest.mark.asyncio
+    async def test_handle_event_gathers_async_handlers(self, tab: Tab) -> None:
+        """Test multiple async handlers run concurrently."""
+        started = asyncio.Event()
+        finished = asyncio.Event()
+
+        async def first(event) -> None:
+            started.set()
+            await finished.wait()
+
+        async def second(event) -> None:
+            # Only reachable while first is still suspended if both
+            # handlers are dispatched concurrently
+            await started.wait()
+            finished.set()
+
+        event_class = type("MockEvent", (), {})
+        tab.on(event_class, first)
+        tab.on(event_class, second)
+
+        async with asyncio.timeout(1.0):
+            await tab.handle_event(event_class())
+
+        assert finished.is_set()
+
+    @pytest.mark.asyncio
+    async def test_handle_event_suppresses_async_exceptions(
+        self, tab: Tab
+    ) -> None:
+        """Test a failing async handler does not stop the others."""
+
+        async def bad_handler(event) -> None:
+            raise ValueError("Handler error")
+
+        other = AsyncMock()
+        event_class = type("MockEvent", (), {})
+        tab.on(event_class, bad_handler)
+        tab.on(event_class, other)
+
+        event = event_class()
+        # Should not raise
+        await tab.handle_event(event)
+
+        other.assert_awaited_once_with(event)
+
     @pytest.mark.asyncio
     async def test_handle_event_suppresses_exceptions(self, tab: Tab) -> None:
         """Test handle_event suppresses handler exceptions."""
@@ -161,11 +285,20 @@ class TestTab:
     @pytest.mark.asyncio
     async def test_navigate(self, tab: Tab, mock_browser: Mock) -> None:
         """Test navigate sends Page.navigate command."""
-        frame_id = cdp.page.FrameId("frame-123")
+        frame_id = _FRAME_ID
         mock_browser.send.return_value = (frame_id, None)
 
-        with patch.object(tab, "wait_for_event", new_callable=AsyncMock):
-            await tab.navigate("https://example.com")
+        async def fire_load() -> None:
+            await asyncio.sleep(0)
+            await tab.handle_event(
+                cdp.page.LoadEventFired(
+                    timestamp=cdp.network.MonotonicTime(1.0)
+                )
+            )
+
+        task = asyncio.create_task(fire_load())
+        await tab.navigate("https://example.com")
+        await task
 
         assert tab._frameid == frame_id
 
@@ -174,7 +307,7 @@ class TestTab:
         self, tab: Tab, mock_browser: Mock
     ) -> None:
         """Test navigate skips wait_for_event when timeout is 0."""
-        frame_id = cdp.page.FrameId("frame-123")
+        frame_id = _FRAME_ID
         mock_browser.send.return_value = (frame_id, None)
 
         await tab.navigate("https://example.com", timeout=0)
@@ -194,87 +327,376 @@ class TestTab:
         assert result == remote_obj
 
     @pytest.mark.asyncio
-    async def test_find_elems_returns_list(
+    async def test_eval_many_single_round_trip(
+        self, tab: Tab, mock_browser: Mock
+    ) -> None:
+        """Test eval_many batches expressions into one evaluate."""
+        remote_obj = Mock()
+        remote_obj.value = [2, "title"]
+        mock_browser.send.return_value = (remote_obj, None)
+
+        result = await tab.eval_many(["1 + 1", "document.title"])
+
+        assert result == [2, "title"]
+        assert mock_browser.send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_eval_many_empty_skips_round_trip(
         self, tab: Tab, mock_browser: Mock
+    ) -> None:
+        """Test eval_many with no expressions sends nothing."""
+        result = await tab.eval_many([])
+
+        assert result == []
+        mock_browser.send.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_find_elems_returns_list(
+        self,
+        tab: Tab,
+        mock_browser: Mock,
+        monkeypatch: pytest.MonkeyPatch,
     ) -> None:
         """Test find_elems returns list of Elem."""
-        # Mock the document
-        doc_node = Mock()
-        doc_node.children = []
-        doc_node.shadow_roots = []
+        mock_browser.send.side_effect = list(_FIND_ELEMS_SIDE_EFFECT)
 
-        search_id = "search-123"
-        count = 2
-        node_ids = [cdp.dom.NodeId(1), cdp.dom.NodeId(2)]
+        mock_elem = Mock(return_value=_ElemStub())
+        monkeypatch.setattr(Tab, "elem", mock_elem)
+        results = await tab.find_elems("button")
+
+        assert len(results) == 2
+        # No frames, so the result is a lazy batch: wrappers are
+        # only built when items are accessed.
+        assert isinstance(results, ElemBatch)
+        mock_elem.assert_not_called()
+        assert results[0] is mock_elem.return_value
+        mock_elem.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_find_elems_reuses_cached_document(
+        self, tab: Tab, mock_browser: Mock
+    ) -> None:
+        """Test find_elems skips get_document when doc is cached."""
+        doc_node = make_node()
+        tab._doc_cache[(100, True)] = doc_node
 
         mock_browser.send.side_effect = [
-            doc_node,  # get_document
-            (search_id, count),  # perform_search
-            node_ids,  # get_search_results
-            None,  # discard_search_results
+            ("search-123", 0),  # perform_search (no get_document)
         ]
 
-        with patch.object(tab, "elem") as mock_elem:
-            mock_elem.return_value = Mock(spec=Elem)
-            results = await tab.find_elems("button")
+        results = await tab.find_elems("button")
 
-        assert len(results) == 2
+        assert results == []
+        assert tab.doc is doc_node
+        assert mock_browser.send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_find_elems_refetches_for_different_depth(
+        self, tab: Tab, mock_browser: Mock
+    ) -> None:
+        """Test a doc cached at one depth is not reused for another."""
+        shallow_doc = make_node()
+        tab._doc_cache[(1, True)] = shallow_doc
+
+        deep_doc = make_node()
+        mock_browser.send.side_effect = [
+            deep_doc,  # get_document at depth 100
+            ("search-123", 0),  # perform_search
+        ]
+
+        results = await tab.find_elems("button")
+
+        assert results == []
+        assert tab.doc is deep_doc
+        assert tab._doc_cache[(100, True)] is deep_doc
+        assert mock_browser.send.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_handle_event_invalidates_document_on_navigation(
+        self, tab: Tab
+    ) -> None:
+        """Test handle_event drops the cached doc on LoadEventFired."""
+        tab.doc = Mock()
+
+        event = cdp.page.LoadEventFired(
+            timestamp=cdp.network.MonotonicTime(123.456)
+        )
+        await tab.handle_event(event)
+
+        assert tab.doc is None
+
+    @pytest.mark.asyncio
+    async def test_handle_event_invalidates_document_on_dom_change(
+        self, tab: Tab
+    ) -> None:
+        """Test a DOM mutation drops the cached doc and node index."""
+        doc_node = make_node(node_id=0)
+        tab.doc = doc_node
+        tab._doc_cache[(100, True)] = doc_node
+        tab._node_index = {cdp.dom.NodeId(0): doc_node}
+
+        event = cdp.dom.ChildNodeInserted(
+            parent_node_id=cdp.dom.NodeId(0),
+            previous_node_id=cdp.dom.NodeId(0),
+            node=make_node(node_id=7),
+        )
+        await tab.handle_event(event)
+
+        assert tab.doc is None
+        assert not tab._doc_cache
+        assert tab._node_index is None
+
+    @pytest.mark.asyncio
+    async def test_query_selector_all_skips_document_fetch(
+        self, tab: Tab, mock_browser: Mock
+    ) -> None:
+        """Test query_selector_all resolves matches via Runtime only."""
+        fn_obj = Mock()
+        fn_obj.object_id = cdp.runtime.RemoteObjectId("fn-1")
+
+        collection = Mock()
+        collection.object_id = cdp.runtime.RemoteObjectId("col-1")
+
+        prop = Mock()
+        prop.enumerable = True
+        prop.value = Mock()
+        prop.value.object_id = cdp.runtime.RemoteObjectId("obj-1")
+
+        node = make_node(node_id=5, backend_node_id=10)
+
+        mock_browser.send.side_effect = [
+            (fn_obj, None),  # Runtime.evaluate (selector fn)
+            (collection, None),  # Runtime.callFunctionOn
+            ([prop], None, None, None),  # Runtime.getProperties
+            node,  # DOM.describeNode
+        ]
+
+        results = await tab.query_selector_all("button.submit")
+
+        assert len(results) == 1
+        assert results[0].backend_node_id == 10
+        assert mock_browser.send.call_count == 4
+
+    @pytest.mark.asyncio
+    async def test_query_selector_reuses_function_handle(
+        self, tab: Tab, mock_browser: Mock
+    ) -> None:
+        """Test repeated queries skip re-evaluating the selector fn."""
+        fn_obj = Mock()
+        fn_obj.object_id = cdp.runtime.RemoteObjectId("fn-1")
+        tab._qsa_fn = fn_obj
+
+        null_obj = Mock()
+        null_obj.object_id = None
+        mock_browser.send.side_effect = [(null_obj, None)]
+
+        result = await tab.query_selector("#missing")
+
+        assert result is None
+        assert mock_browser.send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_count_returns_match_total(
+        self, tab: Tab, mock_browser: Mock
+    ) -> None:
+        """Test count evaluates the match total in one round-trip."""
+        res = Mock()
+        res.value = 3
+        mock_browser.send.return_value = (res, None)
+
+        assert await tab.count("button") == 3
+        assert mock_browser.send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_exists_returns_bool(
+        self, tab: Tab, mock_browser: Mock
+    ) -> None:
+        """Test exists maps the page-side check to a bool."""
+        res = Mock()
+        res.value = False
+        mock_browser.send.return_value = (res, None)
+
+        assert await tab.exists("button") is False
+
+    @pytest.mark.asyncio
+    async def test_wait_for_selector_resolves_via_observer(
+        self,
+        tab: Tab,
+        mock_browser: Mock,
+        monkeypatch: pytest.MonkeyPatch,
+    ) -> None:
+        """Test wait_for_selector uses one observer round-trip."""
+        promise_res = Mock()
+        promise_res.value = True
+        mock_browser.send.side_effect = [(promise_res, None)]
+
+        elem = _ElemStub()
+        monkeypatch.setattr(
+            Tab, "query_selector", AsyncMock(return_value=elem)
+        )
+
+        result = await tab.wait_for_selector("button", timeout=1.0)
+
+        assert result is elem
+        assert mock_browser.send.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_wait_for_selector_returns_none_on_timeout(
+        self, tab: Tab, mock_browser: Mock
+    ) -> None:
+        """Test wait_for_selector returns None when the wait expires."""
+        promise_res = Mock()
+        promise_res.value = False
+        mock_browser.send.side_effect = [(promise_res, None)]
+
+        result = await tab.wait_for_selector("button", timeout=1.0)
+
+        assert result is None
+
+    @pytest.mark.asyncio
+    async def test_query_selector_returns_none_on_no_match(
+        self, tab: Tab, mock_browser: Mock
+    ) -> None:
+        """Test query_selector returns None when nothing matches."""
+        fn_obj = Mock()
+        fn_obj.object_id = cdp.runtime.RemoteObjectId("fn-1")
+
+        null_obj = Mock()
+        null_obj.object_id = None
+        mock_browser.send.side_effect = [(fn_obj, None), (null_obj, None)]
+
+        result = await tab.query_selector("#missing")
+
+        assert result is None
+        assert mock_browser.send.call_count == 2
 
     @pytest.mark.asyncio
-    async def test_find_elem_returns_first(self, tab: Tab) -> None:
+    async def test_find_elem_returns_first(
+        self, tab: Tab, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test find_elem returns first element."""
-        elem1 = Mock(spec=Elem)
-        elem2 = Mock(spec=Elem)
+        elem1 = _ElemStub()
+        elem2 = _ElemStub()
 
-        with patch.object(
-            tab, "find_elems", new_callable=AsyncMock
-        ) as mock_find:
-            mock_find.return_value = [elem1, elem2]
+        monkeypatch.setattr(
+            Tab, "find_elems", AsyncMock(return_value=[elem1, elem2])
+        )
 
-            result = await tab.find_elem("button")
+        result = await tab.find_elem("button")
 
         assert result == elem1
 
     @pytest.mark.asyncio
-    async def test_find_elem_returns_none_when_empty(self, tab: Tab) -> None:
+    async def test_find_elem_returns_none_when_empty(
+        self, tab: Tab, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test find_elem returns None when nothing found."""
-        with patch.object(
-            tab, "find_elems", new_callable=AsyncMock
-        ) as mock_find:
-            mock_find.return_value = []
+        monkeypatch.setattr(Tab, "find_elems", AsyncMock(return_value=[]))
 
-            result = await tab.find_elem("button")
+        result = await tab.find_elem("button")
 
         assert result is None
 
     @pytest.mark.asyncio
-    async def test_wait_for_elem_finds_element(self, tab: Tab) -> None:
+    async def test_wait_for_elems_rechecks_on_dom_change(
+        self, tab: Tab, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test wait_for_elems re-runs the search when the DOM changes."""
+        elem = _ElemStub()
+        results = [[], [elem]]
+
+        mock_find = AsyncMock(side_effect=lambda *a, **kw: results.pop(0))
+        monkeypatch.setattr(Tab, "find_elems", mock_find)
+
+        async def mutate() -> None:
+            await asyncio.sleep(0)
+            await tab.handle_event(cdp.dom.DocumentUpdated())
+
+        task = asyncio.create_task(mutate())
+        found = await tab.wait_for_elems("button", timeout=1.0)
+        await task
+
+        assert found == [elem]
+        assert mock_find.await_count == 2
+
+    @pytest.mark.asyncio
+    async def test_wait_for_elems_removes_change_handlers(
+        self, tab: Tab, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test wait_for_elems unregisters its DOM-change handlers."""
+        monkeypatch.setattr(Tab, "find_elems", AsyncMock(return_value=[]))
+
+        await tab.wait_for_elems("button", timeout=0.05, poll=0.01)
+
+        assert all(not handlers for handlers in tab._handlers.values())
+
+    @pytest.mark.asyncio
+    async def test_wait_for_elem_finds_element(
+        self, tab: Tab, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
         """Test wait_for_elem finds element within timeout."""
-        elem = Mock(spec=Elem)
+        elem = _ElemStub()
 
-        with patch.object(
-            tab, "wait_for_elems", new_callable=AsyncMock
-        ) as mock_wait:
-            mock_wait.return_value = [elem]
+        monkeypatch.setattr(
+            Tab, "wait_for_elems", AsyncMock(return_value=[elem])
+        )
 
-            result = await tab.wait_for_elem("button", timeout=1.0)
+        result = await tab.wait_for_elem("button", timeout=1.0)
 
         assert result == elem
 
     @pytest.mark.asyncio
     async def test_wait_for_elem_returns_none_on_timeout(
-        self, tab: Tab
+        self, tab: Tab, monkeypatch: pytest.MonkeyPatch
     ) -> None:
         """Test wait_for_elem returns None on timeout."""
-        with patch.object(
-            tab, "wait_for_elems", new_callable=AsyncMock
-        ) as mock_wait:
-            mock_wait.return_value = []
+        monkeypatch.setattr(Tab, "wait_for_elems", AsyncMock(return_value=[]))
 
-            result = await tab.wait_for_elem("button", timeout=0.1)
+        result = await tab.wait_for_elem("button", timeout=0.1)
 
         assert result is None
 
+    @pytest.mark.asyncio
+    async def test_positions_batches_elements(self, tab: Tab) -> None:
+        """Test positions gathers element positions concurrently."""
+        elem1 = _ElemStub(position=AsyncMock(return_value="pos-1"))
+        elem2 = _ElemStub(position=AsyncMock(return_value=None))
+
+        results = await tab.positions([elem1, elem2])
+
+        assert results == ["pos-1", None]
+        elem1.position.assert_awaited_once()
+        elem2.position.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_bounding_rects_returns_positions(
+        self, tab: Tab, mock_browser: Mock
+    ) -> None:
+        """Test bounding_rects wraps evaluated quads as Positions."""
+        quad = [10.0, 20.0, 110.0, 20.0, 110.0, 70.0, 10.0, 70.0]
+        result_obj = Mock()
+        result_obj.value = [quad]
+        mock_browser.send.return_value = (result_obj, None)
+
+        positions = await tab.bounding_rects("button")
+
+        assert len(positions) == 1
+        assert positions[0].quad == quad
+        mock_browser.send.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_bounding_rects_empty_when_no_match(
+        self, tab: Tab, mock_browser: Mock
+    ) -> None:
+        """Test bounding_rects returns empty list when nothing matches."""
+        result_obj = Mock()
+        result_obj.value = None
+        mock_browser.send.return_value = (result_obj, None)
+
+        positions = await tab.bounding_rects("button")
+
+        assert positions == []
+
     @pytest.mark.asyncio
     async def test_close(self, tab: Tab, mock_browser: Mock) -> None:
         """Test close sends close_target command."""
@@ -309,12 +731,15 @@ class TestTab:
     def test_getattr_raises_on_missing(self) -> None:
         """Test __getattr__ raises AttributeError for missing attributes."""
         browser = Mock()
-        target_id = cdp.target.TargetID("target-123")
-        target_info = Mock(spec=["type_", "url", "title", "target_id"])
-        target_info.type_ = "page"
-        target_info.url = "https://example.com"
-        target_info.title = "Example"
-        target_info.target_id = target_id
+        target_id = _TARGET_ID
+        # SimpleNamespace raises AttributeError for unset attributes
+        # on its own; no Mock spec whitelist needed
+        target_info = SimpleNamespace(
+            type_="page",
+            url="https://example.com",
+            title="Example",
+            target_id=target_id,
+        )
 
         tab = Tab(browser, target_id, target_info)
 
@@ -328,26 +753,75 @@ class TestTab:
         """Test wait_for_event waits for an event to fire."""
         event_class = cdp.page.LoadEventFired
 
-        # Simulate event firing after a short delay
+        # Fire after a single yield, which is enough for wait_for_event
+        # to register its waiter; a real delay would only add wall-time
         async def fire_event():
-            await asyncio.sleep(0.05)
+            await asyncio.sleep(0)
             event = event_class(timestamp=cdp.network.MonotonicTime(123.456))
             await tab.handle_event(event)
 
-        # Run both concurrently
-        task = asyncio.create_task(fire_event())
-        await tab.wait_for_event(event_class, timeout=1.0)
-        await task
+        # Run both concurrently; gather needs no extra task object
+        await asyncio.gather(
+            tab.wait_for_event(event_class, timeout=1.0), fire_event()
+        )
 
         # Should complete without timeout
 
     @pytest.mark.asyncio
+    @pytest.mark.slow
     async def test_wait_for_event_times_out(self, tab: Tab) -> None:
         """Test wait_for_event times out when event doesn't fire."""
         event_class = cdp.page.LoadEventFired
 
         # Should timeout quickly and not raise
-        await tab.wait_for_event(event_class, timeout=0.1)
+        await tab.wait_for_event(event_class, timeout=0.01)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_event_timeout_suppressed_without_wait(
+        self, tab: Tab, monkeypatch: pytest.MonkeyPatch
+    ) -> None:
+        """Test the timeout path without spending real wall-clock time."""
+
+        class _InstantTimeout:
+            """asyncio.timeout stand-in that expires immediately."""
+
+            def __init__(self, delay: float) -> None:
+                pass
+
+            async def __aenter__(self) -> "_InstantTimeout":
+                raise TimeoutError
+
+            async def __aexit__(self, *exc: object) -> bool:
+                return False
+
+        monkeypatch.setattr(asyncio, "timeout", _InstantTimeout)
+        event_class = cdp.page.LoadEventFired
+
+        # Should suppress the timeout and clean up its one-shot waiter
+        await tab.wait_for_event(event_class, timeout=5.0)
+
+        assert not tab._once_handlers.get(event_class)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_event_unregisters_on_timeout(
+        self, tab: Tab
+    ) -> None:
+        """Test a timed-out wait does not leak its one-shot handler."""
+        event_class = cdp.page.LoadEventFired
+
+        await tab.wait_for_event(event_class, timeout=0.01)
+        await tab.wait_for_event(event_class, timeout=0.01)
+
+        assert not tab._once_handlers.get(event_class)
+
+    @pytest.mark.asyncio
+    async def test_wait_for_event_zero_timeout_returns_at_once(
+        self, tab: Tab
+    ) -> None:
+        """Test a zero timeout registers nothing and returns."""
+        await tab.wait_for_event(cdp.page.LoadEventFired, timeout=0)
+
+        assert not tab._once_handlers
 
     @pytest.mark.asyncio
     async def test_elem_raises_when_doc_not_loaded(self, tab: Tab) -> None:
@@ -360,11 +834,7 @@ class TestTab:
     @pytest.mark.asyncio
     async def test_elem_raises_when_node_not_found(self, tab: Tab) -> None:
         """Test elem raises ValueError when node not found."""
-        doc_node = Mock()
-        doc_node.node_id = 0
-        doc_node.children = []
-        doc_node.shadow_roots = []
-        tab.doc = doc_node
+        tab.doc = make_node(node_id=0)
 
         with pytest.raises(ValueError, match="Node with id .* not found"):
             tab.elem(node_id=cdp.dom.NodeId(999))
@@ -372,48 +842,52 @@ class TestTab:
     @pytest.mark.asyncio
     async def test_elem_finds_node_in_children(self, tab: Tab) -> None:
         """Test elem finds node in document children."""
-        child_node = Mock()
-        child_node.node_id = 5
-        child_node.backend_node_id = 10
-        child_node.children = []
-        child_node.shadow_roots = []
-
-        doc_node = Mock()
-        doc_node.node_id = 0
-        doc_node.children = [child_node]
-        doc_node.shadow_roots = []
-        tab.doc = doc_node
+        child_node = make_node(node_id=5, backend_node_id=10)
+        tab.doc = make_node(node_id=0, children=[child_node])
 
         result = tab.elem(node_id=cdp.dom.NodeId(5))
 
         assert result.node_id == 5
         assert result.backend_node_id == 10
 
+    @pytest.mark.asyncio
+    async def test_elem_memoizes_by_backend_node_id(self, tab: Tab) -> None:
+        """Test elem returns the same instance for repeated lookups."""
+        child_node = make_node(node_id=5, backend_node_id=10)
+        tab.doc = make_node(
+            node_id=0, backend_node_id=1, children=[child_node]
+        )
+
+        first = tab.elem(node_id=cdp.dom.NodeId(5))
+        second = tab.elem(node_id=cdp.dom.NodeId(5))
+
+        assert first is second
+
+    @pytest.mark.asyncio
+    async def test_elem_builds_node_index_once(self, tab: Tab) -> None:
+        """Test elem reuses the node index instead of re-walking."""
+        child_node = make_node(node_id=5, backend_node_id=10)
+        doc_node = make_node(
+            node_id=0, backend_node_id=1, children=[child_node]
+        )
+        tab.doc = doc_node
+
+        tab.elem(node_id=cdp.dom.NodeId(5))
+        # Detaching the child from the tree does not affect lookups
+        # served from the index built on the first call.
+        doc_node.children = []
+
+        result = tab.elem(node_id=cdp.dom.NodeId(5))
+
+        assert result.node_id == 5
+
     @pytest.mark.asyncio
     async def test_elem_finds_node_in_content_document(self, tab: Tab) -> None:
         """Test elem finds node in content document (iframe)."""
-        target_node = Mock()
-        target_node.node_id = 10
-        target_node.backend_node_id = 20
-        target_node.children = []
-        target_node.shadow_roots = []
-
-        content_doc = Mock()
-        content_doc.node_id = 5
-        content_doc.children = [target_node]
-        content_doc.shadow_roots = []
-
-        iframe_node = Mock()
-        iframe_node.node_id = 2
-        iframe_node.content_document = content_doc
-        iframe_node.children = []
-        iframe_node.shadow_roots = []
-
-        doc_node = Mock()
-        doc_node.node_id = 0
-        doc_node.children = [iframe_node]
-        doc_node.shadow_roots = []
-        tab.doc = doc_node
+        target_node = make_node(node_id=10, backend_node_id=20)
+        content_doc = make_node(node_id=5, children=[target_node])
+        iframe_node = make_node(node_id=2, content_document=content_doc)
+        tab.doc = make_node(node_id=0, children=[iframe_node])
 
         result = tab.elem(node_id=cdp.dom.NodeId(10))
 
@@ -423,20 +897,11 @@ class TestTab:
         self, tab: Tab, mock_browser: Mock
     ) -> None:
         """Test _frame_nodes finds iframe elements."""
-        # Create iframe node
-        iframe_node = Mock()
-        iframe_node.node_name = "IFRAME"
-        iframe_node.frame_id = cdp.page.FrameId("frame-123")
-        iframe_node.children = []
-        iframe_node.shadow_roots = []
-
-        # Create doc with iframe
-        doc_node = Mock()
-        doc_node.children = [iframe_node]
-        doc_node.shadow_roots = []
-
-        # Mock browser targets
-        frame_tab = Mock()
+        iframe_node = make_node("IFRAME", frame_id=_FRAME_ID)
+        doc_node = make_node(children=[iframe_node])
+
+        # Identity-only sentinel; _frame_nodes never calls into it
+        frame_tab = object()
         mock_browser.targets = {cdp.target.TargetID("frame-123"): frame_tab}
 
         result = tab._frame_nodes(doc_node)
@@ -448,16 +913,11 @@ class TestTab:
         self, tab: Tab, mock_browser: Mock
     ) -> None:
         """Test _frame_nodes handles iframe without target."""
-        # Create iframe node with no matching target
-        iframe_node = Mock()
-        iframe_node.node_name = "IFRAME"
-        iframe_node.frame_id = cdp.page.FrameId("unknown-frame")
-        iframe_node.children = []
-        iframe_node.shadow_roots = []
-
-        doc_node = Mock()
-        doc_node.children = [iframe_node]
-        doc_node.shadow_roots = []
+        # Iframe node with no matching target
+        iframe_node = make_node(
+            "IFRAME", frame_id=cdp.page.FrameId("unknown-frame")
+        )
+        doc_node = make_node(children=[iframe_node])
 
         mock_browser.targets = {}
 
@@ -467,15 +927,8 @@ class TestTab:
 
     def test_frame_nodes_handles_no_frame_id(self, tab: Tab) -> None:
         """Test _frame_nodes handles iframe without frame_id."""
-        iframe_node = Mock()
-        iframe_node.node_name = "IFRAME"
-        iframe_node.frame_id = None
-        iframe_node.children = []
-        iframe_node.shadow_roots = []
-
-        doc_node = Mock()
-        doc_node.children = [iframe_node]
-        doc_node.shadow_roots = []
+        iframe_node = make_node("IFRAME", frame_id=None)
+        doc_node = make_node(children=[iframe_node])
 
         result = tab._frame_nodes(doc_node)
 
@@ -485,24 +938,13 @@ class TestTab:
         self, tab: Tab, mock_browser: Mock
     ) -> None:
         """Test _frame_nodes searches recursively."""
-        # Nested iframe
-        nested_iframe = Mock()
-        nested_iframe.node_name = "IFRAME"
-        nested_iframe.frame_id = cdp.page.FrameId("nested-123")
-        nested_iframe.children = []
-        nested_iframe.shadow_roots = []
-
-        # Parent div containing iframe
-        div_node = Mock()
-        div_node.node_name = "DIV"
-        div_node.children = [nested_iframe]
-        div_node.shadow_roots = []
-
-        doc_node = Mock()
-        doc_node.children = [div_node]
-        doc_node.shadow_roots = []
-
-        frame_tab = Mock()
+        nested_iframe = make_node(
+            "IFRAME", frame_id=cdp.page.FrameId("nested-123")
+        )
+        div_node = make_node("DIV", children=[nested_iframe])
+        doc_node = make_node(children=[div_node])
+
+        frame_tab = object()
         mock_browser.targets = {cdp.target.TargetID("nested-123"): frame_tab}
 
         result = tab._frame_nodes(doc_node)
@@ -527,7 +969,7 @@ class TestTab:
         """Test that parent property returns parent tab for iframes."""
         # Create parent tab
         parent_target_id = cdp.target.TargetID("parent-target-789")
-        parent_tab = Mock()
+        parent_tab = object()
         mock_browser.targets[parent_target_id] = parent_tab
 
         # Set parent frame ID on child tab
@@ -537,6 +979,37 @@ class TestTab:
 
         assert parent == parent_tab
 
+    def test_root_returns_self_for_top_level(
+        self, tab: Tab, mock_browser: Mock
+    ) -> None:
+        """Test root returns the tab itself for top-level tabs."""
+        tab.target_info.parent_frame_id = None
+
+        assert tab.root is tab
+
+    def test_root_returns_top_level_ancestor(
+        self, tab: Tab, mock_browser: Mock
+    ) -> None:
+        """Test root walks up to the outermost ancestor tab."""
+        parent_target_id = cdp.target.TargetID("parent-target-789")
+        parent_tab = SimpleNamespace(parent=None)
+        mock_browser.targets[parent_target_id] = parent_tab
+
+        tab.target_info.parent_frame_id = "parent-target-789"
+
+        assert tab.root == parent_tab
+
+    def test_root_invalidated_on_target_info_change(
+        self, tab: Tab, mock_browser: Mock
+    ) -> None:
+        """Test reassigning target_info drops the cached root."""
+        tab.target_info.parent_frame_id = None
+        assert tab.root is tab
+
+        tab.target_info = SimpleNamespace(parent_frame_id=None)
+
+        assert tab._root is None
+
     def test_parent_property_returns_none_when_parent_not_found(
         self, tab: Tab, mock_browser: Mock
     ) -> None:
@@ -589,12 +1062,7 @@ class TestTabCustomization:
         tab = CustomTab(mock_browser, target_id)
 
         # Setup doc
-        root_node = Mock()
-        root_node.node_id = 1
-        root_node.backend_node_id = 10
-        root_node.children = []
-        root_node.shadow_roots = []
-        tab.doc = root_node
+        tab.doc = make_node(node_id=1, backend_node_id=10)
 
         # elem() should create CustomElem instance
         elem = tab.elem(cdp.dom.NodeId(1))
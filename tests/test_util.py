@@ -1,6 +1,7 @@
 """Tests for util module."""
 
-from unittest.mock import AsyncMock, Mock
+import copy
+from types import SimpleNamespace
 
 import pytest
 
@@ -9,83 +10,98 @@ from pypecdp.elem import Elem
 from pypecdp.util import CookieJar, tab_attached
 
 
+# Wrapped once at import: tab_attached is deterministic, so each test
+# awaits a pre-decorated callable instead of re-running the decorator
+@tab_attached
+async def _success(self):
+    return "success"
+
+
+@tab_attached
+async def _not_executed(self):
+    return "should not execute"
+
+
+@tab_attached
+async def _session_not_found(self):
+    raise RuntimeError("Session with given id not found")
+
+
+@tab_attached
+async def _other_error(self):
+    raise RuntimeError("Some other error")
+
+
+@tab_attached
+async def _with_args(self, arg1, arg2, kwarg1=None):
+    return f"{arg1}-{arg2}-{kwarg1}"
+
+
+@tab_attached
+async def _no_return(self):
+    pass
+
+
 class TestTabAttachedDecorator:
     """Test suite for @tab_attached decorator."""
 
-    @pytest.fixture
-    def mock_tab(self) -> Mock:
-        """Create a mock Tab."""
-        tab = Mock()
-        tab.target_id = "target-123"
-        tab.session_id = "session-456"
-        return tab
+    @pytest.fixture(scope="module")
+    def mock_tab(self) -> SimpleNamespace:
+        """Create a plain Tab stand-in.
+
+        Module-scoped: the decorator under test only reads attributes,
+        so one instance serves the whole class and SimpleNamespace is
+        enough — no call recording needed. The single test that nulls
+        session_id restores it afterwards.
+        """
+        return SimpleNamespace(
+            target_id="target-123", session_id="session-456"
+        )
 
-    @pytest.fixture
-    def mock_elem(self, mock_tab: Mock) -> Elem:
-        """Create a mock Elem."""
-        node = Mock()
-        node.node_id = 1
-        node.backend_node_id = 2
+    @pytest.fixture(scope="module")
+    def mock_elem(self, mock_tab: SimpleNamespace) -> Elem:
+        """Create an Elem over plain stand-ins."""
+        node = SimpleNamespace(node_id=1, backend_node_id=2)
         return Elem(tab=mock_tab, node=node)
 
-    @pytest.mark.asyncio
     async def test_decorator_allows_execution_when_session_active(
         self, mock_elem: Elem
     ) -> None:
         """Test decorator allows execution when session_id is not None."""
-
-        @tab_attached
-        async def test_method(self):
-            return "success"
-
-        result = await test_method(mock_elem)
+        result = await _success(mock_elem)
         assert result == "success"
 
-    @pytest.mark.asyncio
     async def test_decorator_raises_reference_error_when_session_none(
         self, mock_elem: Elem
     ) -> None:
         """Test decorator raises ReferenceError when session_id is None."""
+        old_session = mock_elem.tab.session_id
         mock_elem.tab.session_id = None
 
-        @tab_attached
-        async def test_method(self):
-            return "should not execute"
+        try:
+            with pytest.raises(
+                ReferenceError, match="Target .* is no longer available"
+            ):
+                await _not_executed(mock_elem)
+        finally:
+            mock_elem.tab.session_id = old_session
 
-        with pytest.raises(
-            ReferenceError, match="Target .* is no longer available"
-        ):
-            await test_method(mock_elem)
-
-    @pytest.mark.asyncio
     async def test_decorator_catches_session_not_found_error(
         self, mock_elem: Elem
     ) -> None:
         """Test decorator catches 'Session with given id not found' RuntimeError."""
-
-        @tab_attached
-        async def test_method(self):
-            raise RuntimeError("Session with given id not found")
-
         with pytest.raises(
             ReferenceError, match="Target .* is no longer available"
         ):
-            await test_method(mock_elem)
+            await _session_not_found(mock_elem)
 
-    @pytest.mark.asyncio
     async def test_decorator_preserves_other_runtime_errors(
         self, mock_elem: Elem
     ) -> None:
         """Test decorator doesn't catch other RuntimeErrors."""
-
-        @tab_attached
-        async def test_method(self):
-            raise RuntimeError("Some other error")
-
         with pytest.raises(RuntimeError, match="Some other error"):
-            await test_method(mock_elem)
+            await _other_error(mock_elem)
 
-    @pytest.mark.asyncio
     async def test_decorator_preserves_function_metadata(self) -> None:
         """Test decorator preserves function name and docstring."""
 
@@ -97,48 +113,54 @@ class TestTabAttachedDecorator:
         assert test_method.__name__ == "test_method"
         assert test_method.__doc__ == "Test docstring."
 
-    @pytest.mark.asyncio
     async def test_decorator_passes_args_and_kwargs(
         self, mock_elem: Elem
     ) -> None:
         """Test decorator passes through args and kwargs."""
-
-        @tab_attached
-        async def test_method(self, arg1, arg2, kwarg1=None):
-            return f"{arg1}-{arg2}-{kwarg1}"
-
-        result = await test_method(mock_elem, "a", "b", kwarg1="c")
+        result = await _with_args(mock_elem, "a", "b", kwarg1="c")
         assert result == "a-b-c"
 
-    @pytest.mark.asyncio
     async def test_decorator_with_no_return_value(
         self, mock_elem: Elem
     ) -> None:
         """Test decorator works with methods that return None."""
+        result = await _no_return(mock_elem)
+        assert result is None
 
-        @tab_attached
-        async def test_method(self):
-            pass
 
-        result = await test_method(mock_elem)
-        assert result is None
+def _make_cookie(**overrides: object) -> cdp.network.Cookie:
+    """Build a CDP cookie with boring defaults, overridable per test."""
+    kwargs: dict = dict(
+        name="c",
+        value="v",
+        domain="example.com",
+        path="/",
+        size=10,
+        http_only=False,
+        secure=False,
+        session=False,
+        priority=cdp.network.CookiePriority.MEDIUM,
+        source_scheme=cdp.network.CookieSourceScheme.UNSET,
+        source_port=-1,
+        expires=0.0,
+    )
+    kwargs.update(overrides)
+    return cdp.network.Cookie(**kwargs)
 
 
 class TestCookieJar:
     """Test suite for CookieJar class."""
 
-    @pytest.fixture
-    def sample_cdp_cookie(self) -> cdp.network.Cookie:
-        """Create a sample CDP cookie for testing."""
-        return cdp.network.Cookie(
+    @pytest.fixture(scope="module")
+    def _sample_cookie_template(self) -> cdp.network.Cookie:
+        """Build the persistent sample cookie once per module."""
+        return _make_cookie(
             name="test_cookie",
             value="test_value",
             domain=".example.com",
-            path="/",
             size=20,
             http_only=True,
             secure=True,
-            session=False,
             priority=cdp.network.CookiePriority.MEDIUM,
             source_scheme=cdp.network.CookieSourceScheme.SECURE,
             source_port=443,
@@ -147,24 +169,46 @@ class TestCookieJar:
         )
 
     @pytest.fixture
-    def session_cdp_cookie(self) -> cdp.network.Cookie:
-        """Create a session CDP cookie for testing."""
-        return cdp.network.Cookie(
+    def sample_cdp_cookie(
+        self, _sample_cookie_template: cdp.network.Cookie
+    ) -> cdp.network.Cookie:
+        """Create a sample CDP cookie for testing.
+
+        Shallow-copies the module-scoped template: some tests rebind
+        attributes (domain, http_only), so each test gets its own
+        instance without re-running the full constructor.
+        """
+        return copy.copy(_sample_cookie_template)
+
+    @pytest.fixture(scope="module")
+    def _session_cookie_template(self) -> cdp.network.Cookie:
+        """Build the session sample cookie once per module."""
+        return _make_cookie(
             name="session_cookie",
             value="session_value",
-            domain="example.com",
             path="/app",
             size=25,
-            http_only=False,
-            secure=False,
             session=True,
             priority=cdp.network.CookiePriority.LOW,
-            source_scheme=cdp.network.CookieSourceScheme.UNSET,
-            source_port=-1,
             expires=-1.0,  # Session cookie
-            same_site=None,
         )
 
+    @pytest.fixture
+    def session_cdp_cookie(
+        self, _session_cookie_template: cdp.network.Cookie
+    ) -> cdp.network.Cookie:
+        """Create a session CDP cookie for testing."""
+        return copy.copy(_session_cookie_template)
+
+    @pytest.fixture(scope="module")
+    def converted(self, _sample_cookie_template: cdp.network.Cookie):
+        """Convert the sample cookie through CookieJar once per module.
+
+        The single-assertion tests below only read the converted
+        cookie, so one jar construction serves all of them.
+        """
+        return list(CookieJar([_sample_cookie_template]))[0]
+
     def test_cookiejar_initialization_empty(self) -> None:
         """Test CookieJar can be initialized empty."""
         jar = CookieJar()
@@ -179,12 +223,9 @@ class TestCookieJar:
         assert len(jar) == 1
         assert jar.cdp_cookies == [sample_cdp_cookie]
 
-    def test_cookiejar_converts_cdp_cookie_attributes(
-        self, sample_cdp_cookie: cdp.network.Cookie
-    ) -> None:
+    def test_cookiejar_converts_cdp_cookie_attributes(self, converted) -> None:
         """Test CookieJar correctly converts CDP cookie attributes."""
-        jar = CookieJar([sample_cdp_cookie])
-        cookie = list(jar)[0]
+        cookie = converted
 
         assert cookie.name == "test_cookie"
         assert cookie.value == "test_value"
@@ -193,26 +234,26 @@ class TestCookieJar:
         assert cookie.secure is True
         assert cookie._rest.get("HttpOnly") == "True"
 
+    @pytest.mark.parametrize(
+        "domain,initial_dot",
+        [(".example.com", True), ("example.com", False)],
+    )
     def test_cookiejar_handles_domain_initial_dot(
-        self, sample_cdp_cookie: cdp.network.Cookie
+        self,
+        sample_cdp_cookie: cdp.network.Cookie,
+        domain: str,
+        initial_dot: bool,
     ) -> None:
         """Test CookieJar sets domain_initial_dot correctly."""
-        jar = CookieJar([sample_cdp_cookie])
-        cookie = list(jar)[0]
-        assert cookie.domain_initial_dot is True
-
-        # Test without leading dot
-        sample_cdp_cookie.domain = "example.com"
-        jar = CookieJar([sample_cdp_cookie])
-        cookie = list(jar)[0]
-        assert cookie.domain_initial_dot is False
+        sample_cdp_cookie.domain = domain
+        cookie = list(CookieJar([sample_cdp_cookie]))[0]
+        assert cookie.domain_initial_dot is initial_dot
 
     def test_cookiejar_handles_persistent_cookie_expiry(
-        self, sample_cdp_cookie: cdp.network.Cookie
+        self, converted
     ) -> None:
         """Test CookieJar handles persistent cookie expiry correctly."""
-        jar = CookieJar([sample_cdp_cookie])
-        cookie = list(jar)[0]
+        cookie = converted
 
         assert cookie.discard is False
         assert cookie.expires == 1735689600
@@ -229,21 +270,19 @@ class TestCookieJar:
         assert cookie.discard is True
         assert cookie.expires is None
 
+    @pytest.mark.parametrize(
+        "http_only,expected", [(True, "True"), (False, "False")]
+    )
     def test_cookiejar_handles_http_only_attribute(
-        self, sample_cdp_cookie: cdp.network.Cookie
+        self,
+        sample_cdp_cookie: cdp.network.Cookie,
+        http_only: bool,
+        expected: str,
     ) -> None:
         """Test CookieJar stores HttpOnly in rest dict."""
-        # HttpOnly = True
-        sample_cdp_cookie.http_only = True
-        jar = CookieJar([sample_cdp_cookie])
-        cookie = list(jar)[0]
-        assert cookie._rest.get("HttpOnly") == "True"
-
-        # HttpOnly = False
-        sample_cdp_cookie.http_only = False
-        jar = CookieJar([sample_cdp_cookie])
-        cookie = list(jar)[0]
-        assert cookie._rest.get("HttpOnly") == "False"
+        sample_cdp_cookie.http_only = http_only
+        cookie = list(CookieJar([sample_cdp_cookie]))[0]
+        assert cookie._rest.get("HttpOnly") == expected
 
     def test_cookiejar_handles_multiple_cookies(
         self,
@@ -287,39 +326,22 @@ class TestCookieJar:
 
     def test_cookiejar_handles_none_expires(self) -> None:
         """Test CookieJar handles None expires value."""
-        cookie = cdp.network.Cookie(
-            name="test",
-            value="value",
-            domain="example.com",
-            path="/",
-            size=10,
-            http_only=False,
-            secure=False,
-            session=False,
-            priority=cdp.network.CookiePriority.MEDIUM,
-            source_scheme=cdp.network.CookieSourceScheme.UNSET,
-            source_port=-1,
-            expires=None,  # Unrepresentable value
-        )
+        cookie = _make_cookie(
+            name="test", value="value", expires=None
+        )  # Unrepresentable expires
 
         jar = CookieJar([cookie])
         converted_cookie = list(jar)[0]
         assert converted_cookie.expires is None
         assert converted_cookie.discard is False  # Not a session cookie
 
-    def test_cookiejar_cookie_version_is_netscape(
-        self, sample_cdp_cookie: cdp.network.Cookie
-    ) -> None:
+    def test_cookiejar_cookie_version_is_netscape(self, converted) -> None:
         """Test CookieJar creates Netscape-style cookies (version 0)."""
-        jar = CookieJar([sample_cdp_cookie])
-        cookie = list(jar)[0]
-        assert cookie.version == 0
+        assert converted.version == 0
 
     def test_cookiejar_cookie_domain_and_path_specified(
-        self, sample_cdp_cookie: cdp.network.Cookie
+        self, converted
     ) -> None:
         """Test CookieJar sets domain_specified and path_specified."""
-        jar = CookieJar([sample_cdp_cookie])
-        cookie = list(jar)[0]
-        assert cookie.domain_specified is True
-        assert cookie.path_specified is True
+        assert converted.domain_specified is True
+        assert converted.path_specified is True